@@ -1,11 +1,27 @@
 #!/usr/bin/env python3
 
 
+import io
 import os
+import re
+import sys
+import hashlib
+import binascii
+import quopri
+import ssl
+import zlib
 import imaplib
-import email
+import queue
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from email.header import decode_header
+from email import policy
+from email.parser import BytesHeaderParser
+from email.utils import collapse_rfc2231_value, decode_params, unquote
 from getpass import getpass
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate, cycle, islice, repeat
 from datetime import datetime
 
 # ---------- Simple ANSI Colors (for terminals that support it) ---------- #
@@ -16,12 +32,57 @@ CYAN = "\033[96m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+# Messages requested per IMAP FETCH command; large enough to amortize the
+# round trip, small enough to stay within server response limits.
+FETCH_CHUNK = 500
+
+# Extra logins used to fetch batches concurrently when there is more than one;
+# servers usually cap simultaneous connections per account at around 10.
+FETCH_CONNECTIONS = 4
+
+# Encoded attachment bytes decoded and written per step (a multiple of 4 for base64).
+DECODE_BLOCK = 64 * 1024
+
+# Messages per analysis before header/body parsing moves to a process pool,
+# and messages handed to a worker per task.
+PROCESS_MIN_MESSAGES = 200
+PROCESS_CHUNK = 16
+
+# Headers and MIME layout only; PEEK keeps the server from setting \Seen.
+SUMMARY_QUERY = "(BODY.PEEK[HEADER] BODYSTRUCTURE)"
+
+# Fields checked for suspicious keywords, in report order.
+KEYWORD_FIELDS = ("FROM", "TO", "SUBJECT", "BODY")
+
+# One TLS context for every connection: CA certificates are loaded once and
+# sessions kept in TLS_SESSIONS can be resumed by later logins to the same host.
+TLS_CONTEXT = ssl.create_default_context()
+TLS_SESSIONS = {}
+
+# Logged-in sessions keyed by (server, user, password digest), reused when the
+# examiner runs another analysis against the same account.
+IMAP_CONNECTIONS = {}
+
+# Drops CR/LF from attachment names and maps path separators to "_", in one pass.
+FILENAME_TRANS = str.maketrans({"\r": None, "\n": None, os.sep: "_", **({os.altsep: "_"} if os.altsep else {})})
+
+# Headers shown for every analyzed message (lowercase, first occurrence wins).
+SUMMARY_HEADERS = frozenset(("from", "to", "subject", "date"))
+
+# Tokens of an IMAP response line: parens, quoted strings, and atoms/numbers.
+IMAP_TOKEN = re.compile(rb'(\()|(\))|"((?:[^"\\]|\\.)*)"|([^\s()"]+)')
+
 # ----------------- Helper Functions ----------------- #
 
 def decode_header_str(value):
     """Decode MIME-encoded header to readable string."""
     if not value:
         return ""
+    # Nothing to decode without an encoded-word; skips decode_header's regex split.
+    if isinstance(value, str) and "=?" not in value:
+        return value
+    # decode_header already merges adjacent words sharing a charset, so this
+    # loop runs once per charset run rather than once per encoded-word.
     parts = decode_header(value)
     decoded = []
     for text, enc in parts:
@@ -34,146 +95,558 @@ def decode_header_str(value):
             decoded.append(text)
     return "".join(decoded)
 
-def save_attachments(msg, output_dir):
-    """Save attachments in the given message to output_dir. Returns list of saved file paths."""
-    if not os.path.isdir(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
-
-    saved_files = []
-    for part in msg.walk():
-        if part.get_content_maintype() == "multipart":
-            continue
-        if part.get("Content-Disposition") is None:
+class DeflateIMAP4_SSL(imaplib.IMAP4_SSL):
+    """IMAP4_SSL with TLS session resumption and optional COMPRESS=DEFLATE (RFC 4978)."""
+
+    def __init__(self, host):
+        self._deflate = self._inflate = None
+        super().__init__(host, ssl_context=TLS_CONTEXT)
+
+    def _create_socket(self, timeout):
+        sock = imaplib.IMAP4._create_socket(self, timeout)
+        return self.ssl_context.wrap_socket(sock, server_hostname=self.host,
+                                            session=TLS_SESSIONS.get(self.host))
+
+    def login(self, user, password):
+        result = super().login(user, password)
+        # TLS 1.3 tickets arrive after the handshake, so save the session once we have talked
+        TLS_SESSIONS[self.host] = self.sock.session
+        return result
+
+    def enable_compression(self):
+        """Switch the stream to raw DEFLATE if the server offers it; returns True when active."""
+        if "COMPRESS=DEFLATE" not in self.capabilities:
+            # many servers only advertise COMPRESS once authenticated
+            typ, data = self.capability()
+            if typ == "OK":
+                self.capabilities = tuple(data[-1].decode().upper().split())
+        if "COMPRESS=DEFLATE" not in self.capabilities:
+            return False
+        typ, _ = self.xatom("COMPRESS", "DEFLATE")
+        if typ != "OK":
+            return False
+        self._deflate = zlib.compressobj(wbits=-15)
+        self._inflate = zlib.decompressobj(wbits=-15)
+        self._inbuf = bytearray()
+        return True
+
+    def _fill(self):
+        """Inflate the next chunk from the socket into _inbuf; False at EOF."""
+        data = self.file.read1(DECODE_BLOCK)
+        if not data:
+            return False
+        self._inbuf += self._inflate.decompress(data)
+        return True
+
+    def read(self, size):
+        if self._inflate is None:
+            return super().read(size)
+        while len(self._inbuf) < size and self._fill():
+            pass
+        data = bytes(self._inbuf[:size])
+        del self._inbuf[:size]
+        return data
+
+    def readline(self):
+        if self._inflate is None:
+            return super().readline()
+        while (end := self._inbuf.find(b"\n")) < 0:
+            if len(self._inbuf) > imaplib._MAXLINE:
+                raise self.error("got more than %d bytes" % imaplib._MAXLINE)
+            if not self._fill():
+                end = len(self._inbuf) - 1
+                break
+        line = bytes(self._inbuf[:end + 1])
+        del self._inbuf[:end + 1]
+        return line
+
+    def send(self, data):
+        if self._deflate is not None:
+            data = self._deflate.compress(data) + self._deflate.flush(zlib.Z_SYNC_FLUSH)
+        super().send(data)
+
+# compat32 keeps header values exactly as the message carried them; only the
+# RFC 2047 encoded-words are decoded later, so spoofed or malformed values survive.
+HEADER_PARSER = BytesHeaderParser(policy=policy.compat32)
+
+def safe_filename(name):
+    """Reduce an attachment name to a bare file name so it cannot escape the output folder."""
+    name = os.path.basename(name).translate(FILENAME_TRANS)
+    return name if name not in ("", ".", "..") else "attachment"
+
+@lru_cache(maxsize=4096)
+def decode_header_cached(raw):
+    """Unfold one raw header value and decode its RFC 2047 words; senders and thread subjects repeat across a mailbox."""
+    if not raw.isascii():
+        # compat32 keeps undecodable 8-bit header bytes as surrogate escapes
+        raw = raw.encode("utf-8", "surrogateescape").decode("utf-8", errors="ignore")
+    return decode_header_str(raw.replace("\r\n", "").replace("\n", ""))
+
+def header_fields(msg):
+    """One pass over the raw headers; returns ({name: decoded} for SUMMARY_HEADERS, unfolded Received lines)."""
+    fields = {}
+    received = []
+    for name, raw in msg.raw_items():
+        key = name.lower()
+        if key == "received":
+            received.append(f"Received: {' '.join(raw.split())}")
+        elif key in SUMMARY_HEADERS and key not in fields:
+            fields[key] = decode_header_cached(raw)
+    return fields, received
+
+def parse_fetch_response(data):
+    """Parse imaplib FETCH data into {msg_id: {ITEM_NAME: value}}; lists stay nested, NIL is None."""
+    stack = [[]]
+    for item in data:
+        if item is None:
             continue
+        # imaplib splits each literal out as (b'... {size}', literal_bytes)
+        text, literal = item if isinstance(item, tuple) else (item, None)
+        if literal is not None:
+            text = text[:text.rindex(b"{")]
+        for opening, closing, quoted, atom in IMAP_TOKEN.findall(text):
+            if opening:
+                stack.append([])
+            elif closing:
+                done = stack.pop()
+                stack[-1].append(done)
+            elif atom:
+                stack[-1].append(None if atom.upper() == b"NIL" else atom)
+            else:
+                stack[-1].append(re.sub(rb"\\(.)", rb"\1", quoted))
+        if literal is not None:
+            stack[-1].append(literal)
+
+    responses = {}
+    top = stack[0]
+    for num, items in zip(top[::2], top[1::2]):
+        fields = responses.setdefault(num, {})
+        for name, value in zip(items[::2], items[1::2]):
+            fields[name.upper()] = value
+    return responses
+
+def fetch_items(mail, msg_ids, query):
+    """Issue one FETCH for msg_ids; returns {msg_id: {ITEM_NAME: value}}."""
+    status, data = mail.fetch(b",".join(msg_ids), query)
+    if status != "OK":
+        print(f"[!] Failed to fetch message IDs {msg_ids[0].decode()}-{msg_ids[-1].decode()}")
+        return {}
+    return parse_fetch_response(data)
+
+def imap_params(value):
+    """Turn a BODYSTRUCTURE parameter list into a dict with lowercase keys.
+
+    RFC 2231 parameters (filename*, filename*0*, filename*1, ...) are joined and
+    decoded from their declared charset and stored under the plain name.
+    """
+    if not isinstance(value, list):
+        return {}
+    pairs = [(k.decode().lower(), (v or b"").decode("utf-8", errors="ignore"))
+             for k, v in zip(value[::2], value[1::2])]
+    if not any("*" in name for name, _ in pairs):
+        return dict(pairs)
+    params = {}
+    # decode_params leaves its first pair alone (normally the content type)
+    for name, val in decode_params([("", "")] + pairs)[1:]:
+        params[name] = unquote(collapse_rfc2231_value(val)) if isinstance(val, tuple) else collapse_rfc2231_value(val)
+    return params
+
+def body_parts(structure, section=""):
+    """Flatten a parsed BODYSTRUCTURE into (section, content_type, params, encoding, disposition) leaves."""
+    if not isinstance(structure, list) or not structure:
+        return
+    if isinstance(structure[0], list):
+        for n, sub in enumerate(structure, start=1):
+            if not isinstance(sub, list):
+                break
+            yield from body_parts(sub, f"{section}.{n}" if section else str(n))
+        return
 
-        filename = part.get_filename()
-        if filename:
-            filename = decode_header_str(filename)
-            safe_name = filename.replace("\r", "").replace("\n", "").replace(os.sep, "_")
-            file_path = os.path.join(output_dir, safe_name)
-            with open(file_path, "wb") as f:
-                f.write(part.get_payload(decode=True))
-            saved_files.append(file_path)
-    return saved_files
-
-def extract_text_body_snippet(msg, max_len=250):
-    """Extract a short text body snippet from an email message."""
-    body_text = ""
+    ctype = f"{(structure[0] or b'').decode()}/{(structure[1] or b'').decode()}".lower()
+    if ctype == "message/rfc822" and len(structure) > 8 and isinstance(structure[8], list):
+        # a forwarded message: descend into its own body; a single-part body is <section>.1
+        nested = structure[8]
+        section = section or "1"
+        if nested and isinstance(nested[0], list):
+            yield from body_parts(nested, section)
+        else:
+            yield from body_parts(nested, f"{section}.1")
+        return
+    encoding = (structure[5] or b"7bit").decode().lower()
+    # Extension data starts after the type-specific fields: lines for text/*,
+    # envelope + body + lines for message/rfc822; disposition follows md5.
+    if ctype.startswith("text/"):
+        md5_index = 8
+    elif ctype == "message/rfc822":
+        md5_index = 10
+    else:
+        md5_index = 7
+    disposition = structure[md5_index + 1] if len(structure) > md5_index + 1 else None
+    if isinstance(disposition, list) and disposition:
+        disposition = ((disposition[0] or b"").decode().lower(),
+                       imap_params(disposition[1] if len(disposition) > 1 else None))
+    else:
+        disposition = None
+    yield section or "1", ctype, imap_params(structure[2]), encoding, disposition
+
+def analyze_structure(structure):
+    """Walk a parsed BODYSTRUCTURE once; returns (text_part, attachments).
+
+    text_part is the first text/plain leaf that is not an attachment (or None); attachments
+    lists (section, filename, encoding) for leaves with a disposition and a filename.
+    """
+    text_part = None
+    attachments = []
+    for part in body_parts(structure):
+        section, ctype, params, encoding, disposition = part
+        if disposition is not None:
+            filename = disposition[1].get("filename") or params.get("name")
+            if filename:
+                attachments.append((section, filename, encoding))
+        if text_part is None and ctype == "text/plain" and (
+                disposition is None or "attachment" not in disposition[0]):
+            text_part = part
+    return text_part, attachments
+
+def decode_part(payload, encoding):
+    """Undo the Content-Transfer-Encoding of a fetched body part."""
+    if not payload:
+        return b""
     try:
-        if msg.is_multipart():
-            for part in msg.walk():
-                ctype = part.get_content_type()
-                disp = str(part.get("Content-Disposition") or "").lower()
-                if ctype == "text/plain" and "attachment" not in disp:
-                    payload = part.get_payload(decode=True)
-                    if payload:
-                        body_text = payload.decode(part.get_content_charset() or "utf-8", errors="ignore")
-                        break
+        if encoding == "base64":
+            return binascii.a2b_base64(payload)
+        if encoding == "quoted-printable":
+            return quopri.decodestring(payload)
+    except binascii.Error:
+        pass
+    return payload
+
+def process_raw(header_bytes, text_payload, text_part, keywords, max_len=250):
+    """Parse, decode and keyword-scan one message from its fetched header block and text part.
+
+    Top-level and free of connection state so it can run in a worker process.
+    """
+    fields, received_lines = header_fields(HEADER_PARSER.parsebytes(header_bytes or b""))
+    body_text = ""
+    if text_part:
+        payload = decode_part(text_payload, text_part[3])
+        try:
+            body_text = payload.decode(text_part[2].get("charset") or "utf-8", errors="ignore")
+        except LookupError:
+            body_text = payload.decode("utf-8", errors="ignore")
+    body_snippet = extract_text_body_snippet(body_text, max_len)
+
+    from_ = fields.get("from", "")
+    to_ = fields.get("to", "")
+    subject = fields.get("subject", "")
+    keyword_hits = []
+    if keywords:
+        keyword_hits = find_keyword_hits(keywords.pattern, from_, to_, subject, body_snippet)
+    return {
+        "from": from_,
+        "to": to_,
+        "subject_raw": subject,
+        "subject": highlight_keyword(subject, keywords),
+        "date": fields.get("date", ""),
+        "received_headers": received_lines,
+        "body_snippet": highlight_keyword(body_snippet, keywords),
+        "keyword_hits": keyword_hits,
+        "suspicious": bool(keyword_hits),
+    }
+
+def fetch_summaries(mail, msg_ids, keywords, max_len=250, pool=None):
+    """Fetch headers, MIME structure and the text/plain part for msg_ids in FETCH_CHUNK batches.
+
+    Yields (msg_id, attachments, process_raw result); attachment bodies are not downloaded.
+    With a process pool the per-message parsing of each batch is spread over its workers.
+    """
+    for start in range(0, len(msg_ids), FETCH_CHUNK):
+        chunk = msg_ids[start:start + FETCH_CHUNK]
+        summaries = []
+        text_sections = {}
+        for num, items in fetch_items(mail, chunk, SUMMARY_QUERY).items():
+            text_part, attachments = analyze_structure(items.get(b"BODYSTRUCTURE"))
+            if text_part:
+                text_sections.setdefault(text_part[0], []).append(num)
+            summaries.append((num, items.get(b"BODY[HEADER]"), attachments, text_part))
+
+        # One FETCH per distinct text section ("1", "1.1", ...) covers the whole chunk.
+        bodies = {}
+        for section, nums in text_sections.items():
+            key = f"BODY[{section}]".encode()
+            for num, items in fetch_items(mail, nums, f"(BODY.PEEK[{section}])").items():
+                bodies[num] = items.get(key)
+
+        headers = [header for _, header, _, _ in summaries]
+        payloads = [bodies.get(num) for num, _, _, _ in summaries]
+        text_parts = [text_part for _, _, _, text_part in summaries]
+        if pool is None:
+            results = map(process_raw, headers, payloads, text_parts, repeat(keywords), repeat(max_len))
         else:
-            if msg.get_content_type() == "text/plain":
-                payload = msg.get_payload(decode=True)
-                if payload:
-                    body_text = payload.decode(msg.get_content_charset() or "utf-8", errors="ignore")
-    except Exception:
-        body_text = ""
+            results = pool.map(process_raw, headers, payloads, text_parts, repeat(keywords), repeat(max_len),
+                               chunksize=PROCESS_CHUNK)
+        for (num, _, attachments, _), info in zip(summaries, results):
+            yield num, attachments, info
+
+def connect(imap_server, email_user, email_pass):
+    """Return a logged-in connection for the account, reusing a cached session that still answers NOOP."""
+    key = (imap_server, email_user, hashlib.sha256(email_pass.encode()).hexdigest())
+    mail = IMAP_CONNECTIONS.pop(key, None)
+    if mail is not None:
+        try:
+            if mail.noop()[0] == "OK":
+                IMAP_CONNECTIONS[key] = mail
+                print(f"{GREEN}[+] Reusing existing IMAP session.{RESET}")
+                return mail
+        except (imaplib.IMAP4.error, OSError):
+            pass
+
+    mail = DeflateIMAP4_SSL(imap_server)
+    mail.login(email_user, email_pass)
+    print(f"{GREEN}[+] Login successful.{RESET}")
+    if mail.enable_compression():
+        print("[*] IMAP compression (COMPRESS=DEFLATE) enabled.")
+    IMAP_CONNECTIONS[key] = mail
+    return mail
+
+def close_connections():
+    """Log out every cached IMAP session."""
+    for mail in IMAP_CONNECTIONS.values():
+        try:
+            mail.logout()
+        except (imaplib.IMAP4.error, OSError):
+            pass
+    IMAP_CONNECTIONS.clear()
+
+def open_extra_connections(imap_server, email_user, email_pass, mailbox, count):
+    """Open up to count more read-only sessions on mailbox; stops at the first failure."""
+    conns = []
+    for _ in range(count):
+        try:
+            conn = DeflateIMAP4_SSL(imap_server)
+            conn.login(email_user, email_pass)
+            conn.enable_compression()
+            status, _ = conn.select(mailbox, readonly=True)
+            if status != "OK":
+                conn.logout()
+                break
+        except (imaplib.IMAP4.error, OSError) as e:
+            print(f"[!] Could not open an extra IMAP connection ({e}); continuing with {len(conns) + 1}.")
+            break
+        conns.append(conn)
+    return conns
+
+def fetch_summaries_parallel(mail, extra_conns, msg_ids, keywords, max_len=250, pool=None):
+    """Like fetch_summaries, but FETCH_CHUNK batches are fetched over extra_conns in parallel.
+
+    Results are yielded in msg_ids order, so later batches download while earlier ones are printed.
+    """
+    chunks = [msg_ids[start:start + FETCH_CHUNK] for start in range(0, len(msg_ids), FETCH_CHUNK)]
+    if not extra_conns or len(chunks) < 2:
+        yield from fetch_summaries(mail, msg_ids, keywords, max_len, pool)
+        return
+
+    # imaplib connections are not thread-safe: each batch borrows one exclusively.
+    idle = queue.Queue()
+    for conn in extra_conns:
+        idle.put(conn)
+
+    def fetch_chunk(chunk):
+        conn = idle.get()
+        try:
+            return list(fetch_summaries(conn, chunk, keywords, max_len, pool))
+        finally:
+            idle.put(conn)
+
+    with ThreadPoolExecutor(max_workers=len(extra_conns)) as fetchers:
+        for summaries in fetchers.map(fetch_chunk, chunks):
+            yield from summaries
+
+def write_decoded(f, payload, encoding):
+    """Write payload to f, undoing its transfer encoding DECODE_BLOCK bytes at a time.
+
+    Only one decoded block is held in memory instead of a full decoded copy of the attachment.
+    """
+    if not payload:
+        return
+    if encoding == "base64":
+        carry = b""
+        for start in range(0, len(payload), DECODE_BLOCK):
+            block = carry + payload[start:start + DECODE_BLOCK].translate(None, b" \t\r\n")
+            cut = len(block) - len(block) % 4
+            f.write(binascii.a2b_base64(block[:cut]))
+            carry = block[cut:]
+        if carry:
+            # Unpadded tail: pad it like the email package does, drop it if still invalid.
+            try:
+                f.write(binascii.a2b_base64(carry + b"=="))
+            except binascii.Error:
+                pass
+    elif encoding == "quoted-printable":
+        # Cut on line ends so no =XX escape or soft line break straddles two blocks.
+        start = 0
+        while start < len(payload):
+            end = payload.find(b"\n", start + DECODE_BLOCK)
+            end = len(payload) if end < 0 else end + 1
+            f.write(binascii.a2b_qp(payload[start:end]))
+            start = end
+    else:
+        f.write(payload)
 
+def save_attachments(mail, msg_id, attachments, output_dir):
+    """Download the given attachment parts of one message into output_dir. Returns list of saved file paths."""
+    query = "(" + " ".join(f"BODY.PEEK[{section}]" for section, _, _ in attachments) + ")"
+    items = fetch_items(mail, [msg_id], query).get(msg_id, {})
+
+    saved_files = []
+    for section, filename, encoding in attachments:
+        filename = decode_header_str(filename)
+        safe_name = safe_filename(filename)
+        file_path = os.path.join(output_dir, safe_name)
+        with open(file_path, "wb") as f:
+            write_decoded(f, items.get(f"BODY[{section}]".encode()), encoding)
+        saved_files.append(file_path)
+    return saved_files
+
+def extract_text_body_snippet(body_text, max_len=250):
+    """Shorten a decoded text body to a single-line snippet."""
     body_text = body_text.replace("\r", " ").replace("\n", " ")
     if len(body_text) > max_len:
         return body_text[:max_len] + "..."
     return body_text
 
-def highlight_keyword(text, keyword):
-    """Highlight keyword in text by uppercasing and surrounding with [] (no color here)."""
-    if not keyword:
+Keywords = namedtuple("Keywords", "pattern words")
+
+def parse_keywords(keywords):
+    """Compile comma-separated keywords into one case-insensitive alternation (None if no keyword)."""
+    # Longest first so "password" wins over "pass" when both are given.
+    words = sorted({k.strip().lower() for k in keywords.split(",") if k.strip()}, key=len, reverse=True)
+    if not words:
+        return None
+    return Keywords(re.compile("|".join(map(re.escape, words)), re.IGNORECASE), tuple(words))
+
+def find_keyword_hits(pattern, *fields):
+    """Return the KEYWORD_FIELDS names whose text matches pattern, using one scan over all fields."""
+    blob = "\x00".join(fields)
+    # ends[i] is where field i+1 starts in blob (just past its separator)
+    ends = list(accumulate(len(f) + 1 for f in fields))
+    hits = []
+    pos = 0
+    while (m := pattern.search(blob, pos)):
+        idx = bisect_right(ends, m.start())
+        hits.append(KEYWORD_FIELDS[idx])
+        if idx + 1 == len(fields):
+            break
+        pos = ends[idx]
+    return hits
+
+def highlight_keyword(text, keywords):
+    """Highlight keyword matches in text by uppercasing and surrounding with [] (no color here)."""
+    if keywords is None:
         return text
-    lower = text.lower()
-    key = keyword.lower()
-    result = ""
-    i = 0
-    while i < len(text):
-        if lower[i:i+len(key)] == key:
-            result += "[" + text[i:i+len(key)].upper() + "]"
-            i += len(key)
-        else:
-            result += text[i]
-            i += 1
-    return result
+    if len(keywords.words) == 1 and text.isascii():
+        # One keyword on ASCII text: str.find on a lowered copy is several times
+        # faster than re.sub with a callback, and lower() keeps offsets aligned.
+        key = keywords.words[0]
+        lower = text.lower()
+        out = []
+        i = 0
+        while (j := lower.find(key, i)) != -1:
+            out.append(text[i:j])
+            out.append("[" + text[j:j + len(key)].upper() + "]")
+            i = j + len(key)
+        out.append(text[i:])
+        return "".join(out)
+    return keywords.pattern.sub(lambda m: "[" + m.group(0).upper() + "]", text)
+
+RESULT_FIELDS = (
+    "Case ID", "Examiner", "Evidence Description", "Mode", "IMAP Server", "Email Address",
+    "Mailbox", "Emails Analyzed", "Emails with Attachments", "Suspicious Keyword",
+    "Suspicious Email Count", "Attachments Folder", "User Manual Review", "Conclusion",
+)
+# The labels are fixed, so the table layout is computed once at import.
+RESULT_COL1_WIDTH = max(len(f) for f in ("Field",) + RESULT_FIELDS) + 2
+RESULT_COL2_WIDTH = 60
+RESULT_ROW = f"{{:<{RESULT_COL1_WIDTH}}}| {{:<{RESULT_COL2_WIDTH}}}".format
+RESULT_SEP = "-" * (RESULT_COL1_WIDTH + RESULT_COL2_WIDTH + 3)
 
 def print_result_table(data):
     """Print a result/observation style table like lab record."""
     print("\n==================== EMAIL FORENSICS RESULT TABLE ====================")
-    headers = ["Field", "Value"]
-    rows = [
-        ("Case ID", data["case_id"]),
-        ("Examiner", data["examiner"]),
-        ("Evidence Description", data["evidence_desc"]),
-        ("Mode", data["mode"]),
-        ("IMAP Server", data["imap_server"] or "N/A"),
-        ("Email Address", data["email_user"] or "N/A"),
-        ("Mailbox", data["mailbox"] or "N/A"),
-        ("Emails Analyzed", data["emails_analyzed"]),
-        ("Emails with Attachments", data["emails_with_attachments"]),
-        ("Suspicious Keyword", data["suspicious_keyword"] or "None"),
-        ("Suspicious Email Count", data["suspicious_emails"]),
-        ("Attachments Folder", data["attachments_folder"]),
-        ("User Manual Review", data["user_confirm"]),
-        ("Conclusion", data["conclusion"])
-    ]
-
-    col1_width = max(len(h[0]) for h in [headers] + rows) + 2
-    col2_width = 60
-
-    print("-" * (col1_width + col2_width + 3))
-    print(f"{headers[0]:<{col1_width}}| {headers[1]:<{col2_width}}")
-    print("-" * (col1_width + col2_width + 3))
-    for field, value in rows:
-        if value is None:
-            value = ""
-        print(f"{field:<{col1_width}}| {str(value)[:col2_width]:<{col2_width}}")
-    print("-" * (col1_width + col2_width + 3))
-    print("======================================================================\n")
+    values = (
+        data["case_id"],
+        data["examiner"],
+        data["evidence_desc"],
+        data["mode"],
+        data["imap_server"] or "N/A",
+        data["email_user"] or "N/A",
+        data["mailbox"] or "N/A",
+        data["emails_analyzed"],
+        data["emails_with_attachments"],
+        data["suspicious_keyword"] or "None",
+        data["suspicious_emails"],
+        data["attachments_folder"],
+        data["user_confirm"],
+        data["conclusion"],
+    )
+
+    print("\n".join([
+        RESULT_SEP,
+        RESULT_ROW("Field", "Value"),
+        RESULT_SEP,
+        *[RESULT_ROW(field, str("" if value is None else value)[:RESULT_COL2_WIDTH])
+          for field, value in zip(RESULT_FIELDS, values)],
+        RESULT_SEP,
+        "======================================================================\n",
+    ]))
+
+REPORT_HEADER = (
+    "===== EMAIL FORENSICS REPORT =====\n\n"
+    "Date & Time          : %(datetime)s\n"
+    "Case ID              : %(case_id)s\n"
+    "Examiner Name        : %(examiner)s\n"
+    "Evidence Description : %(evidence_desc)s\n\n"
+    "Mode                 : %(mode)s\n"
+    "IMAP Server          : %(imap_server)s\n"
+    "Email Address        : %(email_user)s\n"
+    "Mailbox              : %(mailbox)s\n\n"
+    "Total Emails Analyzed     : %(emails_analyzed)s\n"
+    "Emails with Attachments   : %(emails_with_attachments)s\n"
+    "Suspicious Keyword        : %(suspicious_keyword)s\n"
+    "Suspicious Email Count    : %(suspicious_emails)s\n"
+    "Attachments Folder        : %(attachments_folder)s\n"
+    "User Manual Review        : %(user_confirm)s\n\n"
+    "Conclusion:\n"
+    "%(conclusion)s\n\n"
+    "----- DETAILED EMAIL ANALYSIS -----\n\n"
+)
 
 def write_report(report_path, summary, email_details):
     """Write a detailed text report for email forensics."""
-    with open(report_path, "w", encoding="utf-8", errors="ignore") as rep:
-        rep.write("===== EMAIL FORENSICS REPORT =====\n\n")
-        rep.write(f"Date & Time          : {summary['datetime']}\n")
-        rep.write(f"Case ID              : {summary['case_id']}\n")
-        rep.write(f"Examiner Name        : {summary['examiner']}\n")
-        rep.write(f"Evidence Description : {summary['evidence_desc']}\n\n")
-
-        rep.write(f"Mode                 : {summary['mode']}\n")
-        rep.write(f"IMAP Server          : {summary['imap_server'] or 'N/A'}\n")
-        rep.write(f"Email Address        : {summary['email_user'] or 'N/A'}\n")
-        rep.write(f"Mailbox              : {summary['mailbox'] or 'N/A'}\n\n")
-
-        rep.write(f"Total Emails Analyzed     : {summary['emails_analyzed']}\n")
-        rep.write(f"Emails with Attachments   : {summary['emails_with_attachments']}\n")
-        rep.write(f"Suspicious Keyword        : {summary['suspicious_keyword'] or 'None'}\n")
-        rep.write(f"Suspicious Email Count    : {summary['suspicious_emails']}\n")
-        rep.write(f"Attachments Folder        : {summary['attachments_folder']}\n")
-        rep.write(f"User Manual Review        : {summary['user_confirm']}\n\n")
-
-        rep.write("Conclusion:\n")
-        rep.write(f"{summary['conclusion']}\n\n")
-
-        rep.write("----- DETAILED EMAIL ANALYSIS -----\n\n")
-        for idx, info in enumerate(email_details, start=1):
-            rep.write(f"Email #{idx}\n")
-            rep.write(f"  Message ID       : {info['msg_id']}\n")
-            rep.write(f"  From             : {info['from']}\n")
-            rep.write(f"  To               : {info['to']}\n")
-            rep.write(f"  Subject          : {info['subject']}\n")
-            rep.write(f"  Date             : {info['date']}\n")
-            rep.write(f"  Attachments      : {info['attachments_count']}\n")
-            rep.write(f"  Suspicious?      : {'YES' if info['suspicious'] else 'NO'}\n")
-            rep.write(f"  Keyword Matches  : {', '.join(info['keyword_hits']) or 'None'}\n")
-            rep.write("  Received Headers (for routing/IP analysis):\n")
-            for line in info["received_headers"]:
-                rep.write(f"    {line}\n")
-            rep.write("  Body Snippet:\n")
-            rep.write(f"    {info['body_snippet']}\n")
-            rep.write("\n")
+    # one string per email block, joined and written in a single call
+    parts = [REPORT_HEADER % dict(summary,
+                                  imap_server=summary["imap_server"] or "N/A",
+                                  email_user=summary["email_user"] or "N/A",
+                                  mailbox=summary["mailbox"] or "N/A",
+                                  suspicious_keyword=summary["suspicious_keyword"] or "None")]
+    for idx, info in enumerate(email_details, start=1):
+        received = "".join(f"    {line}\n" for line in info["received_headers"])
+        parts.append(f"Email #{idx}\n"
+                     f"  Message ID       : {info['msg_id']}\n"
+                     f"  From             : {info['from']}\n"
+                     f"  To               : {info['to']}\n"
+                     f"  Subject          : {info['subject']}\n"
+                     f"  Date             : {info['date']}\n"
+                     f"  Attachments      : {info['attachments_count']}\n"
+                     f"  Suspicious?      : {'YES' if info['suspicious'] else 'NO'}\n"
+                     f"  Keyword Matches  : {', '.join(info['keyword_hits']) or 'None'}\n"
+                     f"  Received Headers (for routing/IP analysis):\n"
+                     f"{received}"
+                     f"  Body Snippet:\n"
+                     f"    {info['body_snippet']}\n\n")
+
+    with open(report_path, "w", encoding="utf-8", errors="ignore", buffering=1 << 20) as rep:
+        rep.write("".join(parts))
 
 # ----------------- ONLINE MODE (IMAP) ----------------- #
 
@@ -201,19 +674,23 @@ def run_online_mode(case_id, examiner, evidence_desc):
 
     print("\nSuggested suspicious keywords (for demo):")
     print("  password, login, bank, alert, invoice, otp, lottery, confidential")
-    suspicious_keyword = input("Enter a suspicious keyword to flag emails (optional): ").strip()
+    suspicious_keyword = input("Enter suspicious keyword(s) to flag emails, comma-separated (optional): ").strip()
+    keywords = parse_keywords(suspicious_keyword)
+    save_choice = input("Download and save attachments? (y/n) [default: y]: ").strip().lower()
+    download_attachments = save_choice not in ["n", "no"]
     print()
 
     attachments_folder = "email_forensics_attachments_online"
+    if download_attachments:
+        os.makedirs(attachments_folder, exist_ok=True)
 
     try:
         print("Connecting to IMAP server and selecting mailbox...\n")
 
-        mail = imaplib.IMAP4_SSL(imap_server)
-        mail.login(email_user, email_pass)
-        print(f"{GREEN}[+] Login successful.{RESET}")
+        mail = connect(imap_server, email_user, email_pass)
 
-        status, _ = mail.select(mailbox)
+        # Read-only (EXAMINE) so the analysis never alters flags on the evidence mailbox.
+        status, _ = mail.select(mailbox, readonly=True)
         if status != "OK":
             print(f"[!] Could not open mailbox: {mailbox}")
             return None
@@ -232,107 +709,94 @@ def run_online_mode(case_id, examiner, evidence_desc):
         print(f"[*] Found {len(all_ids)} emails in '{mailbox}'.")
         print(f"[*] Analyzing last {len(target_ids)} emails.\n")
 
-        print("Analyzing email headers, bodies, and attachments...\n")
-
-        email_details = []
-        emails_with_attachments = 0
-        suspicious_emails = 0
-
-        for num in target_ids:
-            status, msg_data = mail.fetch(num, "(RFC822)")
-            if status != "OK":
-                print(f"[!] Failed to fetch message ID {num}")
-                continue
-
-            msg = email.message_from_bytes(msg_data[0][1])
-
-            msg_id_str = num.decode()
-            from_ = decode_header_str(msg.get("From"))
-            to_ = decode_header_str(msg.get("To"))
-            subj_raw = decode_header_str(msg.get("Subject"))
-            date_ = decode_header_str(msg.get("Date"))
-
-            body_snippet_raw = extract_text_body_snippet(msg, max_len=200)
-
-            print("------------------------------------------------")
-            print(f"Message ID : {msg_id_str}")
-            print(f"From       : {from_}")
-            print(f"To         : {to_}")
-            print(f"Subject    : {subj_raw}")
-            print(f"Date       : {date_}")
-
-            print("\n[Header Analysis - 'Received:' Lines]")
-            headers_str = msg.as_string()
-            received_lines = []
-            for line in headers_str.split("\n"):
-                if line.startswith("Received:"):
-                    line_clean = line.strip()
-                    received_lines.append(line_clean)
-                    print(line_clean)
-
-            saved = save_attachments(msg, output_dir=attachments_folder)
-            attach_count = len(saved)
-            if attach_count > 0:
-                emails_with_attachments += 1
-                print("\n[Attachments saved:]")
-                for fpath in saved:
-                    print(" -", fpath)
-            else:
-                print("\n[No attachments found in this email.]")
-
-            suspicious = False
-            keyword_hits = []
-            body_snippet = body_snippet_raw
-
-            if suspicious_keyword:
-                key_lower = suspicious_keyword.lower()
-                if key_lower in (from_ or "").lower():
-                    suspicious = True
-                    keyword_hits.append("FROM")
-                if key_lower in (to_ or "").lower():
-                    suspicious = True
-                    keyword_hits.append("TO")
-                if key_lower in (subj_raw or "").lower():
-                    suspicious = True
-                    keyword_hits.append("SUBJECT")
-                if key_lower in (body_snippet_raw or "").lower():
-                    suspicious = True
-                    keyword_hits.append("BODY")
-
-                subj_display = highlight_keyword(subj_raw, suspicious_keyword)
-                body_display = highlight_keyword(body_snippet_raw, suspicious_keyword)
-            else:
-                subj_display = subj_raw
-                body_display = body_snippet_raw
-
-            print("\n[Body Snippet]")
-            print(body_display if body_display else "(No text/plain body found)")
-
-            if suspicious:
-                suspicious_emails += 1
-                print(f"\n{RED}[!] This email is flagged as SUSPICIOUS.{RESET}")
-                print("    Keyword hits in:", ", ".join(keyword_hits))
-            else:
-                print(f"\n{GREEN}[+] No suspicious keyword match detected in this email.{RESET}")
-
-            email_details.append({
-                "msg_id": msg_id_str,
-                "from": from_,
-                "to": to_,
-                "subject": subj_display,
-                "date": date_,
-                "attachments_count": attach_count,
-                "suspicious": suspicious,
-                "keyword_hits": keyword_hits,
-                "received_headers": received_lines,
-                "body_snippet": body_display
-            })
-
-            print("------------------------------------------------\n")
+        # worker processes and extra logins are released even if fetching or
+        # processing fails part way
+        extra_conns = []
+        pool = None
+        try:
+            batches = -(-len(target_ids) // FETCH_CHUNK)
+            if batches > 1:
+                extra_conns = open_extra_connections(imap_server, email_user, email_pass, mailbox,
+                                                     min(FETCH_CONNECTIONS, batches))
+
+            print("Analyzing email headers, bodies, and attachments...\n")
+
+            email_details = []
+            emails_with_attachments = 0
+            suspicious_emails = 0
+
+            # Header/body parsing is CPU-bound; large analyses spread it over worker processes.
+            if len(target_ids) >= PROCESS_MIN_MESSAGES:
+                pool = ProcessPoolExecutor()
+
+            for num, attachments, info in fetch_summaries_parallel(mail, extra_conns, target_ids, keywords,
+                                                                    max_len=200, pool=pool):
+                # one write per email instead of a locked stdout call per line
+                out = io.StringIO()
+                msg_id_str = num.decode()
+
+                print("------------------------------------------------", file=out)
+                print(f"Message ID : {msg_id_str}", file=out)
+                print(f"From       : {info['from']}", file=out)
+                print(f"To         : {info['to']}", file=out)
+                print(f"Subject    : {info['subject_raw']}", file=out)
+                print(f"Date       : {info['date']}", file=out)
+
+                print("\n[Header Analysis - 'Received:' Lines]", file=out)
+                for line in info["received_headers"]:
+                    print(line, file=out)
+
+                attach_count = len(attachments)
+                if attach_count > 0:
+                    emails_with_attachments += 1
+                    if download_attachments:
+                        print("\n[Attachments saved:]", file=out)
+                        for fpath in save_attachments(mail, num, attachments, output_dir=attachments_folder):
+                            print(" -", fpath, file=out)
+                    else:
+                        print("\n[Attachments found (not downloaded):]", file=out)
+                        for _, filename, _ in attachments:
+                            print(" -", decode_header_str(filename), file=out)
+                else:
+                    print("\n[No attachments found in this email.]", file=out)
+
+                print("\n[Body Snippet]", file=out)
+                print(info["body_snippet"] or "(No text/plain body found)", file=out)
+
+                if info["suspicious"]:
+                    suspicious_emails += 1
+                    print(f"\n{RED}[!] This email is flagged as SUSPICIOUS.{RESET}", file=out)
+                    print("    Keyword hits in:", ", ".join(info["keyword_hits"]), file=out)
+                else:
+                    print(f"\n{GREEN}[+] No suspicious keyword match detected in this email.{RESET}", file=out)
+
+                email_details.append({
+                    "msg_id": msg_id_str,
+                    "from": info["from"],
+                    "to": info["to"],
+                    "subject": info["subject"],
+                    "date": info["date"],
+                    "attachments_count": attach_count,
+                    "suspicious": info["suspicious"],
+                    "keyword_hits": info["keyword_hits"],
+                    "received_headers": info["received_headers"],
+                    "body_snippet": info["body_snippet"]
+                })
+
+                print("------------------------------------------------\n", file=out)
+                sys.stdout.write(out.getvalue())
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            for conn in extra_conns:
+                try:
+                    conn.logout()
+                except (imaplib.IMAP4.error, OSError):
+                    pass
 
         emails_analyzed = len(email_details)
+        # Back to the authenticated state; the session stays cached for another run.
         mail.close()
-        mail.logout()
 
         mode = "ONLINE (IMAP)"
         return {
@@ -357,6 +821,100 @@ def run_online_mode(case_id, examiner, evidence_desc):
 
 # ----------------- OFFLINE DEMO MODE ----------------- #
 
+SAMPLE_ATTACHMENT = b"This is a simulated attachment for offline demo mode.\n"
+
+BASE_SAMPLES = [
+    {
+        "from": "alice@example.com",
+        "to": "investigator@lab.com",
+        "subject": "Meeting notes and attachments",
+        "date": "Mon, 24 Nov 2025 10:15:00 +0530",
+        "received": [
+            "Received: from mail.example.com (192.0.2.10) by mx.lab.com",
+            "Received: from alice-laptop (10.0.0.5) by mail.example.com"
+        ],
+        "attachments": ["notes.pdf"],
+        "body": "Hi, please find attached the meeting notes and action items. Nothing urgent or suspicious here."
+    },
+    {
+        "from": "suspicious@phish.com",
+        "to": "victim@company.com",
+        "subject": "URGENT: Reset your password immediately",
+        "date": "Tue, 25 Nov 2025 09:01:00 +0530",
+        "received": [
+            "Received: from phish-server.com (203.0.113.77) by mx.company.com"
+        ],
+        "attachments": ["reset_link.html"],
+        "body": "Your account is compromised. Click the link in the attachment to reset your password now, or you will lose access."
+    },
+    {
+        "from": "hr@company.com",
+        "to": "employee@company.com",
+        "subject": "Salary slip for November",
+        "date": "Wed, 26 Nov 2025 18:30:00 +0530",
+        "received": [
+            "Received: from hr-pc (10.0.0.22) by mail.company.com"
+        ],
+        "attachments": ["salary_slip.pdf"],
+        "body": "Please find attached your salary slip for the month. Contact HR if you notice any discrepancy."
+    },
+    {
+        "from": "no-reply@service.com",
+        "to": "user@example.com",
+        "subject": "Your subscription has been renewed",
+        "date": "Thu, 27 Nov 2025 12:00:00 +0530",
+        "received": [
+            "Received: from service.com (198.51.100.5) by mx.example.com"
+        ],
+        "attachments": [],
+        "body": "Thank you for renewing your subscription. This is an automated message; no suspicious content here."
+    },
+    {
+        "from": "alerts@bank.com",
+        "to": "customer@example.com",
+        "subject": "Alert: New login from unknown device",
+        "date": "Fri, 28 Nov 2025 07:45:00 +0530",
+        "received": [
+            "Received: from bank.com (203.0.113.99) by mx.example.com"
+        ],
+        "attachments": ["alert_details.txt"],
+        "body": "We detected a login from an unknown device. If this was not you, please contact the bank immediately."
+    },
+    {
+        "from": "lottery@scam.com",
+        "to": "randomuser@example.com",
+        "subject": "Congratulations! You won the lottery",
+        "date": "Sat, 29 Nov 2025 11:20:00 +0530",
+        "received": [
+            "Received: from scam.com (203.0.113.200) by mx.example.com"
+        ],
+        "attachments": ["claim_form.docx"],
+        "body": "You have WON a huge lottery prize. To claim, send your bank details and ID proof as soon as possible."
+    },
+    {
+        "from": "it-support@company.com",
+        "to": "staff@company.com",
+        "subject": "Planned maintenance window",
+        "date": "Sun, 30 Nov 2025 02:00:00 +0530",
+        "received": [
+            "Received: from support-pc (10.0.0.50) by mail.company.com"
+        ],
+        "attachments": [],
+        "body": "We will perform scheduled maintenance on the servers this weekend. There is no security incident; just routine work."
+    },
+    {
+        "from": "unknown@malicious.net",
+        "to": "target@company.com",
+        "subject": "Invoice attached - please review",
+        "date": "Mon, 01 Dec 2025 15:10:00 +0530",
+        "received": [
+            "Received: from malicious.net (198.51.100.77) by mx.company.com"
+        ],
+        "attachments": ["invoice.exe"],
+        "body": "Please open the attached invoice and confirm the payment status. This file may contain malware."
+    },
+]
+
 def run_offline_mode(case_id, examiner, evidence_desc):
     print("You selected: OFFLINE DEMO mode (sample emails, no real account)\n")
 
@@ -368,7 +926,8 @@ def run_offline_mode(case_id, examiner, evidence_desc):
 
     print("\nSuggested suspicious keywords (for demo):")
     print("  password, login, bank, alert, invoice, otp, lottery, confidential")
-    suspicious_keyword = input("Enter a suspicious keyword to flag emails (optional): ").strip()
+    suspicious_keyword = input("Enter suspicious keyword(s) to flag emails, comma-separated (optional): ").strip()
+    keywords = parse_keywords(suspicious_keyword)
     print()
 
     attachments_folder = "email_forensics_attachments_demo"
@@ -377,102 +936,7 @@ def run_offline_mode(case_id, examiner, evidence_desc):
 
     print("Loading sample email data and simulating analysis...\n")
 
-    base_samples = [
-        {
-            "from": "alice@example.com",
-            "to": "investigator@lab.com",
-            "subject": "Meeting notes and attachments",
-            "date": "Mon, 24 Nov 2025 10:15:00 +0530",
-            "received": [
-                "Received: from mail.example.com (192.0.2.10) by mx.lab.com",
-                "Received: from alice-laptop (10.0.0.5) by mail.example.com"
-            ],
-            "attachments": ["notes.pdf"],
-            "body": "Hi, please find attached the meeting notes and action items. Nothing urgent or suspicious here."
-        },
-        {
-            "from": "suspicious@phish.com",
-            "to": "victim@company.com",
-            "subject": "URGENT: Reset your password immediately",
-            "date": "Tue, 25 Nov 2025 09:01:00 +0530",
-            "received": [
-                "Received: from phish-server.com (203.0.113.77) by mx.company.com"
-            ],
-            "attachments": ["reset_link.html"],
-            "body": "Your account is compromised. Click the link in the attachment to reset your password now, or you will lose access."
-        },
-        {
-            "from": "hr@company.com",
-            "to": "employee@company.com",
-            "subject": "Salary slip for November",
-            "date": "Wed, 26 Nov 2025 18:30:00 +0530",
-            "received": [
-                "Received: from hr-pc (10.0.0.22) by mail.company.com"
-            ],
-            "attachments": ["salary_slip.pdf"],
-            "body": "Please find attached your salary slip for the month. Contact HR if you notice any discrepancy."
-        },
-        {
-            "from": "no-reply@service.com",
-            "to": "user@example.com",
-            "subject": "Your subscription has been renewed",
-            "date": "Thu, 27 Nov 2025 12:00:00 +0530",
-            "received": [
-                "Received: from service.com (198.51.100.5) by mx.example.com"
-            ],
-            "attachments": [],
-            "body": "Thank you for renewing your subscription. This is an automated message; no suspicious content here."
-        },
-        {
-            "from": "alerts@bank.com",
-            "to": "customer@example.com",
-            "subject": "Alert: New login from unknown device",
-            "date": "Fri, 28 Nov 2025 07:45:00 +0530",
-            "received": [
-                "Received: from bank.com (203.0.113.99) by mx.example.com"
-            ],
-            "attachments": ["alert_details.txt"],
-            "body": "We detected a login from an unknown device. If this was not you, please contact the bank immediately."
-        },
-        {
-            "from": "lottery@scam.com",
-            "to": "randomuser@example.com",
-            "subject": "Congratulations! You won the lottery",
-            "date": "Sat, 29 Nov 2025 11:20:00 +0530",
-            "received": [
-                "Received: from scam.com (203.0.113.200) by mx.example.com"
-            ],
-            "attachments": ["claim_form.docx"],
-            "body": "You have WON a huge lottery prize. To claim, send your bank details and ID proof as soon as possible."
-        },
-        {
-            "from": "it-support@company.com",
-            "to": "staff@company.com",
-            "subject": "Planned maintenance window",
-            "date": "Sun, 30 Nov 2025 02:00:00 +0530",
-            "received": [
-                "Received: from support-pc (10.0.0.50) by mail.company.com"
-            ],
-            "attachments": [],
-            "body": "We will perform scheduled maintenance on the servers this weekend. There is no security incident; just routine work."
-        },
-        {
-            "from": "unknown@malicious.net",
-            "to": "target@company.com",
-            "subject": "Invoice attached - please review",
-            "date": "Mon, 01 Dec 2025 15:10:00 +0530",
-            "received": [
-                "Received: from malicious.net (198.51.100.77) by mx.company.com"
-            ],
-            "attachments": ["invoice.exe"],
-            "body": "Please open the attached invoice and confirm the payment status. This file may contain malware."
-        },
-    ]
-
-    samples = []
-    while len(samples) < count:
-        samples.extend(base_samples)
-    samples = samples[:count]
+    samples = list(islice(cycle(BASE_SAMPLES), count))
 
     email_details = []
     emails_with_attachments = 0
@@ -481,6 +945,7 @@ def run_offline_mode(case_id, examiner, evidence_desc):
     print("Analyzing sample email headers, bodies, and attachments...\n")
 
     for i, sample in enumerate(samples, start=1):
+        out = io.StringIO()
         msg_id_str = str(i)
         from_ = sample["from"]
         to_ = sample["to"]
@@ -490,66 +955,58 @@ def run_offline_mode(case_id, examiner, evidence_desc):
         attach_list = sample["attachments"]
         body_raw = sample["body"]
 
-        print("------------------------------------------------")
-        print(f"Message ID : {msg_id_str}")
-        print(f"From       : {from_}")
-        print(f"To         : {to_}")
-        print(f"Subject    : {subj_raw}")
-        print(f"Date       : {date_}")
+        print("------------------------------------------------", file=out)
+        print(f"Message ID : {msg_id_str}", file=out)
+        print(f"From       : {from_}", file=out)
+        print(f"To         : {to_}", file=out)
+        print(f"Subject    : {subj_raw}", file=out)
+        print(f"Date       : {date_}", file=out)
 
-        print("\n[Header Analysis - 'Received:' Lines]")
+        print("\n[Header Analysis - 'Received:' Lines]", file=out)
         for line in received_lines:
-            print(line)
+            print(line, file=out)
 
         attach_count = len(attach_list)
         if attach_count > 0:
             emails_with_attachments += 1
-            print("\n[Attachments simulated & saved:]")
+            print("\n[Attachments simulated & saved:]", file=out)
             for name in attach_list:
-                safe_name = name.replace("\r", "").replace("\n", "").replace(os.sep, "_")
+                safe_name = safe_filename(name)
                 file_path = os.path.join(attachments_folder, f"sample_{msg_id_str}_{safe_name}")
-                with open(file_path, "w") as f:
-                    f.write("This is a simulated attachment for offline demo mode.\n")
-                print(" -", file_path)
+                # Raw descriptor: no buffered text wrapper per tiny file
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, SAMPLE_ATTACHMENT)
+                finally:
+                    os.close(fd)
+                print(" -", file_path, file=out)
         else:
-            print("\n[No attachments in this sample email.]")
+            print("\n[No attachments in this sample email.]", file=out)
 
-        suspicious = False
         keyword_hits = []
 
-        if suspicious_keyword:
-            key_lower = suspicious_keyword.lower()
-            if key_lower in from_.lower():
-                suspicious = True
-                keyword_hits.append("FROM")
-            if key_lower in to_.lower():
-                suspicious = True
-                keyword_hits.append("TO")
-            if key_lower in subj_raw.lower():
-                suspicious = True
-                keyword_hits.append("SUBJECT")
-            if key_lower in body_raw.lower():
-                suspicious = True
-                keyword_hits.append("BODY")
-
-            subj_display = highlight_keyword(subj_raw, suspicious_keyword)
-            body_display = highlight_keyword(body_raw, suspicious_keyword)
+        if keywords:
+            keyword_hits = find_keyword_hits(keywords.pattern, from_, to_, subj_raw, body_raw)
+            subj_display = highlight_keyword(subj_raw, keywords)
+            body_display = highlight_keyword(body_raw, keywords)
         else:
             subj_display = subj_raw
             body_display = body_raw
 
-        print("\n[Body Snippet]")
+        suspicious = bool(keyword_hits)
+
+        print("\n[Body Snippet]", file=out)
         snippet = body_display
         if len(snippet) > 200:
             snippet = snippet[:200] + "..."
-        print(snippet)
+        print(snippet, file=out)
 
         if suspicious:
             suspicious_emails += 1
-            print(f"\n{RED}[!] This sample email is flagged as SUSPICIOUS.{RESET}")
-            print("    Keyword hits in:", ", ".join(keyword_hits))
+            print(f"\n{RED}[!] This sample email is flagged as SUSPICIOUS.{RESET}", file=out)
+            print("    Keyword hits in:", ", ".join(keyword_hits), file=out)
         else:
-            print(f"\n{GREEN}[+] No suspicious keyword match detected in this sample email.{RESET}")
+            print(f"\n{GREEN}[+] No suspicious keyword match detected in this sample email.{RESET}", file=out)
 
         email_details.append({
             "msg_id": msg_id_str,
@@ -564,7 +1021,8 @@ def run_offline_mode(case_id, examiner, evidence_desc):
             "body_snippet": snippet
         })
 
-        print("------------------------------------------------\n")
+        print("------------------------------------------------\n", file=out)
+        sys.stdout.write(out.getvalue())
 
     emails_analyzed = len(email_details)
     mode = "OFFLINE DEMO"
@@ -596,6 +1054,22 @@ def main():
     evidence_desc = input("  Evidence Description   : ").strip() or "N/A"
     print()
 
+    run_no = 1
+    try:
+        while True:
+            report_path = "email_forensics_report.txt" if run_no == 1 else f"email_forensics_report_{run_no}.txt"
+            run_analysis(case_id, examiner, evidence_desc, report_path)
+            again = input("Run another analysis (e.g. another mailbox)? (y/n) [default: n]: ").strip().lower()
+            if again not in ["y", "yes"]:
+                break
+            run_no += 1
+            print()
+    finally:
+        # log out cached IMAP sessions even when an analysis fails or is interrupted
+        close_connections()
+
+def run_analysis(case_id, examiner, evidence_desc, report_path):
+    """Run one online/offline analysis for the case and write its report to report_path."""
     # Mode selection
     print("Select Mode of Operation:")
     print("  1) ONLINE MODE  - Real IMAP server, real email account")
@@ -683,7 +1157,6 @@ def main():
         "conclusion": conclusion
     }
 
-    report_path = "email_forensics_report.txt"
     write_report(report_path, summary, email_details)
 
     print("====================================================")
@@ -2,43 +2,193 @@
 
 import os
 import sys
+import time
+import mmap
+import stat
+import zlib
+import queue
 import hashlib
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 
+CHUNK_SIZE = 8 * 1024 * 1024
+PIPELINE_DEPTH = 4  # read-ahead buffers in flight between the reader thread and hashing/writing
+PROGRESS_INTERVAL = 0.1  # seconds, caps progress output at 10 Hz
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+HASH_ALGOS = ("md5", "sha1", "crc32")
+DEFAULT_HASHES = ("md5", "sha1")
+MATCH_TEXT = {True: "YES (Integrity OK)", False: "NO (Integrity FAILED!)", None: "SKIPPED"}
+MATCH_RESULT = {True: "YES", False: "NO", None: "SKIPPED"}
+
+class CRC32:
+    """hashlib-style wrapper around zlib.crc32, a fast non-forensic integrity check."""
+
+    def __init__(self):
+        self.value = 0
+
+    def update(self, data):
+        self.value = zlib.crc32(data, self.value)
+
+    def hexdigest(self):
+        return f"{self.value:08x}"
+
+def make_hashers(algos):
+    """Return {name: hash object} for the selected algorithms."""
+    return {name: CRC32() if name == "crc32" else hashlib.new(name) for name in algos}
+
 def human_readable_size(size_bytes):
     """Return human readable size string."""
     if size_bytes is None:
         return "UNKNOWN"
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} PB"
-
-def hash_file(path, chunk_size=1024*1024):
-    """Compute MD5 and SHA1 hash of a file."""
-    md5 = hashlib.md5()
-    sha1 = hashlib.sha1()
-    total_read = 0
-
-    with open(path, "rb") as f:
+    # each unit is 2**10 of the previous one, so the bit length picks it directly
+    i = min((size_bytes.bit_length() - 1) // 10, 5) if size_bytes >= 1024 else 0
+    return f"{size_bytes / (1 << (10 * i)):.2f} {SIZE_UNITS[i]}"
+
+def advise_sequential(fd):
+    """Ask the kernel to read ahead aggressively on a sequential scan."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def drop_page_cache(fd):
+    """Flush fd to disk and evict its cached pages so the next read hits the device."""
+    os.fsync(fd)
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+def aligned_chunk_size(fd, chunk_size):
+    """Round chunk_size up to a multiple of the file's preferred I/O block size."""
+    try:
+        blksize = os.fstat(fd).st_blksize
+    except (OSError, AttributeError):
+        return chunk_size
+    if not blksize:
+        return chunk_size
+    return -(-chunk_size // blksize) * blksize
+
+def can_copy_in_kernel(fd):
+    """True when fd is a non-empty regular file and copy_file_range exists."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    st = os.fstat(fd)
+    return stat.S_ISREG(st.st_mode) and st.st_size > 0
+
+def read_blocks(src, chunk_size, mapped):
+    """Yield (offset, block) pairs; mapped sources yield zero-copy mmap views."""
+    offset = 0
+    if mapped:
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                while offset < len(view):
+                    block = view[offset:offset + chunk_size]
+                    size = len(block)
+                    # drop each block's export as soon as the caller is done with it,
+                    # otherwise the mapping cannot be closed
+                    try:
+                        yield offset, block
+                    finally:
+                        block.release()
+                    offset += size
+            finally:
+                view.release()
+        return
+    yield from prefetch_blocks(src, chunk_size)
+
+def prefetch_blocks(src, chunk_size, depth=PIPELINE_DEPTH):
+    """Yield (offset, block) views filled by a reader thread from a ring of reusable buffers.
+
+    Each block is only valid until the next one is requested; the read of the
+    following blocks overlaps with hashing and writing the current one.
+    """
+    free = queue.Queue()
+    filled = queue.Queue()
+    stop = threading.Event()
+    for _ in range(depth):
+        free.put(bytearray(chunk_size))
+
+    def reader():
+        offset = 0
+        try:
+            while True:
+                buf = free.get()
+                if stop.is_set():
+                    return
+                n = src.readinto(buf)
+                if not n:
+                    filled.put(None)
+                    return
+                filled.put((offset, buf, n))
+                offset += n
+        except BaseException as exc:
+            filled.put(exc)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
         while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            md5.update(chunk)
-            sha1.update(chunk)
+            item = filled.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            offset, buf, n = item
+            yield offset, memoryview(buf)[:n]
+            free.put(buf)
+    finally:
+        # wake the reader if it is waiting for a buffer and let it exit
+        stop.set()
+        free.put(None)
+        thread.join()
+
+def kernel_copy(src_fd, dst_fd, block, offset):
+    """Copy block's range in-kernel, writing the bytes ourselves if the filesystem refuses."""
+    done = 0
+    while done < len(block):
+        try:
+            copied = os.copy_file_range(src_fd, dst_fd, len(block) - done, offset + done, offset + done)
+        except OSError:
+            copied = 0
+        if not copied:
+            while done < len(block):
+                done += os.pwrite(dst_fd, block[done:], offset + done)
+            return
+        done += copied
+
+def hash_file(path, algos=DEFAULT_HASHES, chunk_size=CHUNK_SIZE):
+    """Compute the selected hashes of a file; returns {name: hexdigest}."""
+    hashers = make_hashers(algos)
+    total_read = 0
+    next_progress = time.monotonic() + PROGRESS_INTERVAL
+
+    # hashlib drops the GIL on large buffers, so the digests run side by side
+    with open(path, "rb") as f, ThreadPoolExecutor(max_workers=len(hashers)) as pool:
+        advise_sequential(f.fileno())
+        chunk_size = aligned_chunk_size(f.fileno(), chunk_size)
+        for _, chunk in prefetch_blocks(f, chunk_size):
+            wait([pool.submit(h.update, chunk) for h in hashers.values()])
             total_read += len(chunk)
-            sys.stdout.write(f"\r    [VERIFY] Hashed: {human_readable_size(total_read)}")
-            sys.stdout.flush()
-
+            now = time.monotonic()
+            if now >= next_progress:
+                sys.stdout.write(f"\r    [VERIFY] Hashed: {human_readable_size(total_read)}")
+                sys.stdout.flush()
+                next_progress = now + PROGRESS_INTERVAL
+
+    if total_read:
+        sys.stdout.write(f"\r    [VERIFY] Hashed: {human_readable_size(total_read)}")
     print()  # newline after progress
-    return md5.hexdigest(), sha1.hexdigest()
+    return {name: h.hexdigest() for name, h in hashers.items()}
 
-def image_and_hash(source_path, output_path, chunk_size=1024*1024):
-    """Copy source to output while computing MD5 and SHA1."""
-    md5 = hashlib.md5()
-    sha1 = hashlib.sha1()
+def image_and_hash(source_path, output_path, algos=DEFAULT_HASHES, chunk_size=CHUNK_SIZE):
+    """Copy source to output while computing the selected hashes."""
+    hashers = make_hashers(algos)
 
     source_size = None
     try:
@@ -48,24 +198,40 @@ def image_and_hash(source_path, output_path, chunk_size=1024*1024):
         print("[!] Could not determine source size (possibly raw device).")
 
     total_read = 0
+    next_progress = time.monotonic() + PROGRESS_INTERVAL
     print(f"\n[*] Starting disk imaging process")
     print(f"    From: {source_path}")
     print(f"    To  : {output_path}")
-    print("    Copying in 1 MB blocks...\n")
-
-    with open(source_path, "rb", buffering=0) as src, open(output_path, "wb") as dst:
-        while True:
-            chunk = src.read(chunk_size)
-            if not chunk:
-                break
-            dst.write(chunk)
-            md5.update(chunk)
-            sha1.update(chunk)
+    print(f"    Copying in {chunk_size // (1024 * 1024)} MB blocks...\n")
+
+    with open(source_path, "rb", buffering=0) as src, open(output_path, "wb") as dst, \
+            ThreadPoolExecutor(max_workers=len(hashers)) as pool:
+        advise_sequential(src.fileno())
+        chunk_size = aligned_chunk_size(src.fileno(), chunk_size)
+        # regular files are copied by the kernel and hashed straight from the page cache
+        in_kernel = can_copy_in_kernel(src.fileno())
+        for offset, chunk in read_blocks(src, chunk_size, in_kernel):
+            pending = [pool.submit(h.update, chunk) for h in hashers.values()]
+            if in_kernel:
+                kernel_copy(src.fileno(), dst.fileno(), chunk, offset)
+            else:
+                dst.write(chunk)
+            for fut in pending:
+                fut.result()
             total_read += len(chunk)
 
-            sys.stdout.write(f"\r    [COPY] Copied: {human_readable_size(total_read)}")
-            sys.stdout.flush()
+            now = time.monotonic()
+            if now >= next_progress:
+                sys.stdout.write(f"\r    [COPY] Copied: {human_readable_size(total_read)}")
+                sys.stdout.flush()
+                next_progress = now + PROGRESS_INTERVAL
+
+        # make the verify pass read the image back from disk, not from the page cache
+        dst.flush()
+        drop_page_cache(dst.fileno())
 
+    if total_read:
+        sys.stdout.write(f"\r    [COPY] Copied: {human_readable_size(total_read)}")
     print("\n\n[*] Imaging completed.")
     try:
         output_size = os.path.getsize(output_path)
@@ -80,44 +246,40 @@ def image_and_hash(source_path, output_path, chunk_size=1024*1024):
         else:
             print("[!] SIZE CHECK: Source and image sizes DO NOT MATCH!")
 
-    return md5.hexdigest(), sha1.hexdigest(), source_size, output_size
+    return {name: h.hexdigest() for name, h in hashers.items()}, source_size, output_size
+
+REPORT_HEADER = (
+    "===== DISK IMAGING & HASHING REPORT =====\n\n"
+    "Date & Time        : %(datetime)s\n"
+    "Case ID            : %(case_id)s\n"
+    "Examiner Name      : %(examiner)s\n"
+    "Evidence Description: %(evidence_desc)s\n\n"
+    "Source Path        : %(source_path)s\n"
+    "Image Path         : %(output_path)s\n\n"
+    "Source Size        : %(source_size_hr)s\n"
+    "Image Size         : %(output_size_hr)s\n"
+    "Size Match         : %(size_match)s\n\n"
+)
 
 def write_report(report_path, data):
     """Write a simple text report with all details."""
-    with open(report_path, "w") as rep:
-        rep.write("===== DISK IMAGING & HASHING REPORT =====\n\n")
-        rep.write(f"Date & Time        : {data['datetime']}\n")
-        rep.write(f"Case ID            : {data['case_id']}\n")
-        rep.write(f"Examiner Name      : {data['examiner']}\n")
-        rep.write(f"Evidence Description: {data['evidence_desc']}\n\n")
-
-        rep.write(f"Source Path        : {data['source_path']}\n")
-        rep.write(f"Image Path         : {data['output_path']}\n\n")
-
-        rep.write(f"Source Size        : {data['source_size_hr']}\n")
-        rep.write(f"Image Size         : {data['output_size_hr']}\n")
-        rep.write(f"Size Match         : {data['size_match']}\n\n")
-
-        rep.write("---- Hash Values During Imaging ----\n")
-        rep.write(f"MD5 (during copy)  : {data['md5_copy']}\n")
-        rep.write(f"SHA1 (during copy) : {data['sha1_copy']}\n\n")
-
-        rep.write("---- Hash Values During Verification ----\n")
-        rep.write(f"MD5 (verify file)  : {data['md5_verify']}\n")
-        rep.write(f"SHA1 (verify file) : {data['sha1_verify']}\n\n")
+    hashes = data["hashes"]
+    parts = [REPORT_HEADER % data, "---- Hash Values During Imaging ----\n"]
+    parts += [f"{name.upper() + ' (during copy)':<19}: {data[name + '_copy']}\n" for name in hashes]
+    parts.append("\n---- Hash Values During Verification ----\n")
+    parts += [f"{name.upper() + ' (verify file)':<19}: {data[name + '_verify']}\n" for name in hashes]
+    parts.append("\n---- Verification Result ----\n")
+    parts += [f"{name.upper() + ' Match':<19}: {data[name + '_match']}\n" for name in hashes]
+    parts.append(f"User Manual Check  : {data['user_confirm']}\n\n"
+                 f"Conclusion:\n"
+                 f"{data['conclusion']}\n")
 
-        rep.write("---- Verification Result ----\n")
-        rep.write(f"MD5 Match          : {data['md5_match']}\n")
-        rep.write(f"SHA1 Match         : {data['sha1_match']}\n")
-        rep.write(f"User Manual Check  : {data['user_confirm']}\n\n")
-
-        rep.write("Conclusion:\n")
-        rep.write(f"{data['conclusion']}\n")
+    with open(report_path, "w") as rep:
+        rep.write("".join(parts))
 
 def print_result_table(data):
     """Print a result/observation style table like lab record."""
     print("\n==================== RESULT TABLE ====================")
-    headers = ["Field", "Value"]
     rows = [
         ("Case ID", data["case_id"]),
         ("Examiner", data["examiner"]),
@@ -127,30 +289,55 @@ def print_result_table(data):
         ("Source Size", data["source_size_hr"]),
         ("Image Size", data["output_size_hr"]),
         ("Size Match", data["size_match"]),
-        ("MD5 (Copy)", data["md5_copy"]),
-        ("MD5 (Verify)", data["md5_verify"]),
-        ("MD5 Match", data["md5_match"]),
-        ("SHA1 (Copy)", data["sha1_copy"]),
-        ("SHA1 (Verify)", data["sha1_verify"]),
-        ("SHA1 Match", data["sha1_match"]),
+    ]
+    for name in data["hashes"]:
+        label = name.upper()
+        rows += [
+            (f"{label} (Copy)", data[name + "_copy"]),
+            (f"{label} (Verify)", data[name + "_verify"]),
+            (f"{label} Match", data[name + "_match"]),
+        ]
+    rows += [
         ("User Manual Verification", data["user_confirm"]),
         ("Conclusion", data["conclusion"])
     ]
 
-    col1_width = max(len(h[0]) for h in [headers] + rows) + 2
+    col1_width = max(len(r[0]) for r in rows) + 2
     col2_width = 60
 
-    print("-" * (col1_width + col2_width + 3))
-    print(f"{headers[0]:<{col1_width}}| {headers[1]:<{col2_width}}")
-    print("-" * (col1_width + col2_width + 3))
-    for field, value in rows:
-        if value is None:
-            value = ""
-        print(f"{field:<{col1_width}}| {str(value)[:col2_width]:<{col2_width}}")
-    print("-" * (col1_width + col2_width + 3))
-    print("======================================================\n")
+    # build the row template and separator once, then print the table in one call
+    fmt = f"{{:<{col1_width}}}| {{:<{col2_width}}}".format
+    sep = "-" * (col1_width + col2_width + 3)
+    print("\n".join([
+        sep,
+        fmt("Field", "Value"),
+        sep,
+        *[fmt(field, str("" if value is None else value)[:col2_width]) for field, value in rows],
+        sep,
+        "======================================================\n",
+    ]))
+
+def parse_hashes(value):
+    """Parse a comma-separated --hash value into a tuple of algorithm names."""
+    algos = tuple(dict.fromkeys(a.strip().lower() for a in value.split(",") if a.strip()))
+    unknown = [a for a in algos if a not in HASH_ALGOS]
+    if unknown or not algos:
+        raise argparse.ArgumentTypeError(
+            f"choose from {', '.join(HASH_ALGOS)} (got {value!r})")
+    return algos
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Disk Imaging & Hashing Tool")
+    ap.add_argument("--hash", type=parse_hashes, default=DEFAULT_HASHES,
+                    help="comma-separated hashes to compute (md5, sha1, crc32; default: md5,sha1); "
+                         "crc32 alone is a fast non-forensic integrity check")
+    ap.add_argument("--skip-verify", action="store_true",
+                    help="do not re-read the image to verify it; only the copy-time hashes are reported")
+    return ap.parse_args(argv)
 
 def main():
+    args = parse_args()
+
     print("====================================================")
     print("        Disk Imaging & Hashing Tool (Python)")
     print("====================================================\n")
@@ -179,33 +366,34 @@ def main():
 
     try:
         # Imaging + live hashing
-        md5_copy, sha1_copy, source_size, output_size = image_and_hash(source_path, output_path)
+        copy_hashes, source_size, output_size = image_and_hash(source_path, output_path, args.hash)
 
         # Verification hashing
-        print("\n[*] Verifying integrity of the created image using hashes...")
-        md5_verify, sha1_verify = hash_file(output_path)
-
-        md5_match_bool = (md5_copy == md5_verify)
-        sha1_match_bool = (sha1_copy == sha1_verify)
-
-        md5_match = "YES" if md5_match_bool else "NO"
-        sha1_match = "YES" if sha1_match_bool else "NO"
+        if args.skip_verify:
+            print("\n[*] Verification pass skipped (--skip-verify).")
+            verify_hashes = dict.fromkeys(args.hash, "SKIPPED")
+            matches = dict.fromkeys(args.hash)
+        else:
+            print("\n[*] Verifying integrity of the created image using hashes...")
+            verify_hashes = hash_file(output_path, args.hash)
+            matches = {name: copy_hashes[name] == verify_hashes[name] for name in args.hash}
+        hashes_match = all(matches.values())
 
         print("\n================ HASH VALUES (DURING COPY) ================")
         print("Record these in your observation table (Copy Phase):")
-        print(f"MD5  (copy)   : {md5_copy}")
-        print(f"SHA1 (copy)   : {sha1_copy}")
+        for name in args.hash:
+            print(f"{name.upper():<4} (copy)   : {copy_hashes[name]}")
         print("===========================================================\n")
 
         print("================ HASH VALUES (VERIFICATION) ===============")
         print("Record these in your observation table (Verify Phase):")
-        print(f"MD5  (verify) : {md5_verify}")
-        print(f"SHA1 (verify) : {sha1_verify}")
+        for name in args.hash:
+            print(f"{name.upper():<4} (verify) : {verify_hashes[name]}")
         print("===========================================================\n")
 
         print("=============== HASH COMPARISON RESULTS ===================")
-        print(f"MD5 Match  : {'YES (Integrity OK)' if md5_match_bool else 'NO (Integrity FAILED!)'}")
-        print(f"SHA1 Match : {'YES (Integrity OK)' if sha1_match_bool else 'NO (Integrity FAILED!)'}")
+        for name in args.hash:
+            print(f"{name.upper() + ' Match':<10} : {MATCH_TEXT[matches[name]]}")
         print("===========================================================\n")
 
         # Ask user to manually visually confirm hash values
@@ -222,9 +410,11 @@ def main():
         else:
             size_match = "UNKNOWN"
 
-        if md5_match_bool and sha1_match_bool and size_match == "YES":
+        if args.skip_verify:
+            conclusion = "Image created with copy-time hashes only; verification pass was skipped."
+        elif hashes_match and size_match == "YES":
             conclusion = "Image creation SUCCESSFUL. Integrity verified by size and hash match."
-        elif md5_match_bool and sha1_match_bool:
+        elif hashes_match:
             conclusion = "Image hashes match, but size comparison was not fully available."
         else:
             conclusion = "WARNING: Hash mismatch detected. Image may be corrupted or modified."
@@ -239,15 +429,14 @@ def main():
             "source_size_hr": human_readable_size(source_size),
             "output_size_hr": human_readable_size(output_size),
             "size_match": size_match,
-            "md5_copy": md5_copy,
-            "sha1_copy": sha1_copy,
-            "md5_verify": md5_verify,
-            "sha1_verify": sha1_verify,
-            "md5_match": md5_match,
-            "sha1_match": sha1_match,
+            "hashes": args.hash,
             "user_confirm": user_confirm,
             "conclusion": conclusion
         }
+        for name in args.hash:
+            report_data[name + "_copy"] = copy_hashes[name]
+            report_data[name + "_verify"] = verify_hashes[name]
+            report_data[name + "_match"] = MATCH_RESULT[matches[name]]
 
         report_path = "disk_imaging_report.txt"
         write_report(report_path, report_data)
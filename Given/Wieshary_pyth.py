@@ -1,87 +1,111 @@
 #!/usr/bin/env python3
 import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+SCAN_WORKERS = 16
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+FileRec = namedtuple("FileRec", "path size mtime atime ctime")
+
 def human_readable_size(size_bytes):
     if size_bytes is None:
         return "UNKNOWN"
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} PB"
+    # each unit is 2**10 of the previous one, so the bit length picks it directly
+    i = min((size_bytes.bit_length() - 1) // 10, 5) if size_bytes >= 1024 else 0
+    return f"{size_bytes / (1 << (10 * i)):.2f} {SIZE_UNITS[i]}"
+
+def scan_dir(path):
+    """Return (file records, subdirectories) for a single directory."""
+    records = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return records, subdirs
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            # like os.walk, symlinked directories are not followed
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+            continue
+        try:
+            stats = entry.stat()
+            # raw timestamps; only reported files are converted to datetime
+            records.append(FileRec(entry.path, stats.st_size, stats.st_mtime,
+                                   stats.st_atime, stats.st_ctime))
+        except Exception:
+            continue
+    return records, subdirs
 
 def get_file_metadata(root_dir):
-    """Return list of dicts with path, size, and MAC times."""
+    """Return list of FileRec tuples with path, size, and raw MAC timestamps."""
     records = []
-    for base, dirs, files in os.walk(root_dir):
-        for name in files:
-            full_path = os.path.join(base, name)
-            try:
-                stats = os.stat(full_path)
-                size = stats.st_size
-                mtime = datetime.fromtimestamp(stats.st_mtime)
-                atime = datetime.fromtimestamp(stats.st_atime)
-                ctime = datetime.fromtimestamp(stats.st_ctime)
-                records.append({
-                    "path": full_path,
-                    "size": size,
-                    "mtime": mtime,
-                    "atime": atime,
-                    "ctime": ctime,
-                })
-            except Exception:
-                continue
+    # directories are listed and stat'ed in parallel, then collected in os.walk order
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        pending = [pool.submit(scan_dir, root_dir)]
+        while pending:
+            files, subdirs = pending.pop().result()
+            records.extend(files)
+            pending.extend(reversed([pool.submit(scan_dir, d) for d in subdirs]))
     return records
 
 def filter_records(records, ext_filter=None, min_size_bytes=0):
-    filtered = []
-    for r in records:
-        if ext_filter:
-            if not r["path"].lower().endswith(ext_filter.lower()):
-                continue
-        if r["size"] < min_size_bytes:
-            continue
-        filtered.append(r)
+    # one comprehension per criterion; the cheap size test runs first so
+    # fewer paths need lowercasing
+    filtered = list(records)
+    if min_size_bytes > 0:
+        filtered = [r for r in filtered if r.size >= min_size_bytes]
+    if ext_filter:
+        ext = ext_filter.lower()
+        filtered = [r for r in filtered if r.path.lower().endswith(ext)]
     return filtered
 
+REPORT_HEADER = (
+    "===== FILE METADATA & TIMELINE REPORT =====\n\n"
+    "Date & Time          : %(datetime)s\n"
+    "Case ID              : %(case_id)s\n"
+    "Examiner Name        : %(examiner)s\n"
+    "Evidence Description : %(evidence_desc)s\n\n"
+    "Root Directory Scanned   : %(root_dir)s\n"
+    "Total Files Found        : %(total_files)s\n"
+    "Files After Filtering    : %(filtered_files)s\n"
+    "Extension Filter         : %(ext_filter)s\n"
+    "Minimum Size Filter      : %(min_size_kb)s KB\n\n"
+    "Conclusion:\n"
+    "%(conclusion)s\n\n"
+    "----- FILTERED FILE METADATA -----\n\n"
+)
+
 def write_report(report_path, summary, records, interesting_paths):
-    with open(report_path, "w", encoding="utf-8", errors="ignore") as rep:
-        rep.write("===== FILE METADATA & TIMELINE REPORT =====\n\n")
-        rep.write(f"Date & Time          : {summary['datetime']}\n")
-        rep.write(f"Case ID              : {summary['case_id']}\n")
-        rep.write(f"Examiner Name        : {summary['examiner']}\n")
-        rep.write(f"Evidence Description : {summary['evidence_desc']}\n\n")
-
-        rep.write(f"Root Directory Scanned   : {summary['root_dir']}\n")
-        rep.write(f"Total Files Found        : {summary['total_files']}\n")
-        rep.write(f"Files After Filtering    : {summary['filtered_files']}\n")
-        rep.write(f"Extension Filter         : {summary['ext_filter'] or 'None'}\n")
-        rep.write(f"Minimum Size Filter      : {summary['min_size_kb']} KB\n\n")
-
-        rep.write("Conclusion:\n")
-        rep.write(f"{summary['conclusion']}\n\n")
-
-        rep.write("----- FILTERED FILE METADATA -----\n\n")
-        for idx, r in enumerate(records, start=1):
-            rep.write(f"File #{idx}\n")
-            rep.write(f"  Path       : {r['path']}\n")
-            rep.write(f"  Size       : {human_readable_size(r['size'])}\n")
-            rep.write(f"  Modified   : {r['mtime']}\n")
-            rep.write(f"  Accessed   : {r['atime']}\n")
-            rep.write(f"  Created    : {r['ctime']}\n")
-            rep.write("\n")
-
-        rep.write("----- MANUALLY MARKED INTERESTING FILES -----\n\n")
-        if interesting_paths:
-            for p in interesting_paths:
-                rep.write(f" * {p}\n")
-        else:
-            rep.write("No files were manually marked as interesting.\n")
+    # one string per file block, joined and written in a single call
+    parts = [REPORT_HEADER % dict(summary, ext_filter=summary["ext_filter"] or "None")]
+    for idx, r in enumerate(records, start=1):
+        parts.append(f"File #{idx}\n"
+                     f"  Path       : {r.path}\n"
+                     f"  Size       : {human_readable_size(r.size)}\n"
+                     f"  Modified   : {datetime.fromtimestamp(r.mtime)}\n"
+                     f"  Accessed   : {datetime.fromtimestamp(r.atime)}\n"
+                     f"  Created    : {datetime.fromtimestamp(r.ctime)}\n\n")
+
+    parts.append("----- MANUALLY MARKED INTERESTING FILES -----\n\n")
+    if interesting_paths:
+        parts.extend(f" * {p}\n" for p in interesting_paths)
+    else:
+        parts.append("No files were manually marked as interesting.\n")
+
+    with open(report_path, "w", encoding="utf-8", errors="ignore", buffering=1 << 20) as rep:
+        rep.write("".join(parts))
 
 def print_result_table(summary):
     print("\n==================== FILE ANALYSIS RESULT TABLE ====================")
-    headers = ["Field", "Value"]
     rows = [
         ("Case ID", summary["case_id"]),
         ("Examiner", summary["examiner"]),
@@ -98,13 +122,17 @@ def print_result_table(summary):
     col1_width = max(len(r[0]) for r in rows) + 2
     col2_width = 60
 
-    print("-" * (col1_width + col2_width + 3))
-    print(f"{'Field':<{col1_width}}| {'Value':<{col2_width}}")
-    print("-" * (col1_width + col2_width + 3))
-    for field, value in rows:
-        print(f"{field:<{col1_width}}| {str(value)[:col2_width]:<{col2_width}}")
-    print("-" * (col1_width + col2_width + 3))
-    print("====================================================================\n")
+    # build the row template and separator once, then print the table in one call
+    fmt = f"{{:<{col1_width}}}| {{:<{col2_width}}}".format
+    sep = "-" * (col1_width + col2_width + 3)
+    print("\n".join([
+        sep,
+        fmt("Field", "Value"),
+        sep,
+        *[fmt(field, str(value)[:col2_width]) for field, value in rows],
+        sep,
+        "====================================================================\n",
+    ]))
 
 def main():
     print("====================================================")
@@ -151,7 +179,7 @@ def main():
     # Show a preview
     print("\nPreview of filtered files (up to 10):")
     for r in filtered[:10]:
-        print(f" - {r['path']} ({human_readable_size(r['size'])})")
+        print(f" - {r.path} ({human_readable_size(r.size)})")
 
     print("\nYou can mark some files as 'interesting' for further analysis.")
     interesting_paths = []
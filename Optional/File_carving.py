@@ -1,5 +1,8 @@
+import mmap
 import os
+import re
 from datetime import datetime
+from functools import lru_cache
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 SAMPLE_DIR = os.path.join(BASE_DIR, "sample_data")
@@ -36,29 +39,74 @@ SIGNATURES = {
     "txt": (b"TXT_START", b"TXT_END"),
 }
 
-
-def carve_file(image_bytes, ext, header, footer):
-    start = 0
-    carved = []
-    idx = 1
-    while True:
-        hpos = image_bytes.find(header, start)
-        if hpos == -1:
-            break
-        fpos = image_bytes.find(footer, hpos + len(header))
-        if fpos == -1:
-            break
-
-        content_start = hpos + len(header)
-        content_end = fpos
-        data = image_bytes[content_start:content_end]
-        filename = f"carved_{ext}_{idx}.{ext}"
-        out_path = os.path.join(OUTPUT_DIR, filename)
-        with open(out_path, "wb") as out:
-            out.write(data)
-        carved.append(out_path)
-        idx += 1
-        start = fpos + len(footer)
+# raw descriptors for carved output; O_BINARY keeps Windows from translating newlines
+CARVE_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+# marker bytes -> {ext: [is_header, is_footer]}, so one scan serves every signature
+def marker_roles(signatures):
+    roles = {}
+    for ext, (header, footer) in signatures.items():
+        roles.setdefault(header, {}).setdefault(ext, [False, False])[0] = True
+        roles.setdefault(footer, {}).setdefault(ext, [False, False])[1] = True
+    return roles
+
+
+# the chosen signatures' markers and their roles, built once per selection
+@lru_cache(maxsize=None)
+def selected_roles(exts):
+    return marker_roles({ext: SIGNATURES[ext] for ext in exts})
+
+
+# one zero-width lookahead over every selected marker: it matches at each offset
+# where some marker starts, so overlapping markers are all seen in a single pass
+@lru_cache(maxsize=None)
+def marker_scanner(exts):
+    markers = sorted(selected_roles(exts), key=len, reverse=True)
+    pattern = re.compile(b"(?=(" + b"|".join(map(re.escape, markers)) + b"))")
+    return pattern, sorted(markers)
+
+
+# every occurrence of every marker as (offset, marker), in offset order
+def marker_hits(image_bytes, exts):
+    pattern, markers = marker_scanner(exts)
+    for match in pattern.finditer(image_bytes):
+        pos = match.start()
+        for marker in markers:
+            if image_bytes[pos:pos + len(marker)] == marker:
+                yield pos, marker
+
+
+def carve_files(image_bytes, exts):
+    spans = {ext: [] for ext in exts}
+    open_at = dict.fromkeys(exts)
+    resume_at = dict.fromkeys(exts, 0)
+    roles = selected_roles(tuple(spans))
+    for pos, marker in marker_hits(image_bytes, tuple(spans)):
+        for ext, (is_header, is_footer) in roles[marker].items():
+            start = open_at[ext]
+            if start is None:
+                if is_header and pos >= resume_at[ext]:
+                    open_at[ext] = pos + len(marker)
+            elif is_footer and pos >= start:
+                spans[ext].append((start, pos))
+                open_at[ext] = None
+                resume_at[ext] = pos + len(marker)
+
+    carved = {}
+    out_prefix = os.path.join(OUTPUT_DIR, "carved_")
+    for ext in exts:
+        carved[ext] = []
+        for idx, (content_start, content_end) in enumerate(spans[ext], start=1):
+            out_path = f"{out_prefix}{ext}_{idx}.{ext}"
+            data = memoryview(image_bytes[content_start:content_end])
+            fd = os.open(out_path, CARVE_OPEN_FLAGS, 0o644)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            carved[ext].append(out_path)
     return carved
 
 
@@ -96,17 +144,27 @@ def run_carving():
         else:
             print("File not found. Using sample image instead.")
 
+    # map the image instead of reading it, so pages fault in as the scan reaches them
     with open(image_path, "rb") as f:
-        data = f.read()
+        if os.fstat(f.fileno()).st_size:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = b""
 
-    print(f"Loaded {len(data)} bytes from disk image.")
-    types_to_carve = interactive_signature_selection()
+    try:
+        print(f"Loaded {len(data)} bytes from disk image.")
+        types_to_carve = interactive_signature_selection()
+        carved = carve_files(data, types_to_carve)
+    finally:
+        # carve_files copies every span out, so the mapping can go once it returns
+        if isinstance(data, mmap.mmap):
+            data.close()
 
     carved_paths = []
     for ext in types_to_carve:
         header, footer = SIGNATURES[ext]
         print(f"\nCarving for {ext.upper()} using header={header} footer={footer}")
-        results = carve_file(data, ext, header, footer)
+        results = carved[ext]
         if results:
             print(f"Recovered {len(results)} {ext.upper()} file(s):")
             for r in results:
@@ -1,6 +1,12 @@
+import argparse
+import mmap
 import os
-import textwrap
+import re
+import sys
+from bisect import bisect_right
+from collections import namedtuple
 from datetime import datetime
+from operator import itemgetter
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 SAMPLE_DIR = os.path.join(BASE_DIR, "sample_data")
@@ -10,100 +16,204 @@ REPORTS_DIR = os.path.join(BASE_DIR, "reports")
 os.makedirs(SAMPLE_DIR, exist_ok=True)
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
+PROCESS_COLUMNS = ("PID", "PPID", "NAME", "USER", "PATH")
+CONNECTION_COLUMNS = ("LADDR", "LPORT", "RADDR", "RPORT", "PROTO", "PID", "STATE")
+# the parsers pre-fold searched text: lowercase copies are made once here,
+# so filters never call lower() per row
+Process = namedtuple("Process", PROCESS_COLUMNS + ("name_lc",))
+Connection = namedtuple("Connection", CONNECTION_COLUMNS + ("lport_int", "rport_int"))
+DumpString = namedtuple("DumpString", "text text_lc")
+
+SAMPLE_MEMORY_DUMP = (
+    b"# SIMPLE RAM DUMP SIMULATION\n"
+    b"[METADATA]\n"
+    b"capture_time=2025-11-12 10:20:30\n"
+    b"os=Windows 10 x64\n"
+    b"profile=Win10x64\n"
+    b"\n"
+    b"[PROCESSES]\n"
+    b"PID,PPID,NAME,USER,PATH\n"
+    b"4,0,System,SYSTEM,C:\\Windows\\System32\\ntoskrnl.exe\n"
+    b"312,4,smss.exe,SYSTEM,C:\\Windows\\System32\\smss.exe\n"
+    b"528,528,csrss.exe,SYSTEM,C:\\Windows\\System32\\csrss.exe\n"
+    b"612,528,wininit.exe,SYSTEM,C:\\Windows\\System32\\wininit.exe\n"
+    b"720,612,services.exe,SYSTEM,C:\\Windows\\System32\\services.exe\n"
+    b"800,612,lsass.exe,SYSTEM,C:\\Windows\\System32\\lsass.exe\n"
+    b"1400,720,svchost.exe,LOCAL SERVICE,C:\\Windows\\System32\\svchost.exe\n"
+    b"1500,720,svchost.exe,NETWORK SERVICE,C:\\Windows\\System32\\svchost.exe\n"
+    b"2000,720,chrome.exe,User,C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe\n"
+    b"2100,720,chrome.exe,User,C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe\n"
+    b"2500,720,unknown_malware.exe,User,C:\\Users\\User\\AppData\\Roaming\\evil\\unknown_malware.exe\n"
+    b"\n"
+    b"[NETWORK]\n"
+    b"LADDR,LPORT,RADDR,RPORT,PROTO,PID,STATE\n"
+    b"192.168.1.10,49200,142.250.71.238,443,TCP,2000,ESTABLISHED\n"
+    b"192.168.1.10,49201,142.250.71.238,443,TCP,2100,ESTABLISHED\n"
+    b"192.168.1.10,50000,185.203.113.55,4444,TCP,2500,ESTABLISHED\n"
+    b"192.168.1.10,53,8.8.8.8,53,UDP,720,OPEN\n"
+    b"192.168.1.10,137,0.0.0.0,0,UDP,720,LISTEN\n"
+    b"\n"
+    b"[STRINGS]\n"
+    b'"C2_SERVER=185.203.113.55"\n'
+    b'"Mimikatz was here"\n'
+    b'"Password=SuperSecret123"\n'
+    b'"malware payload injected"\n'
+)
+
+SAMPLE_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+DEFAULT_IOCS = ("mimikatz", "payload", "C2_SERVER", "Password")
+SECTION_HEADER_RE = re.compile(rb"^\[(.*)\]\r?$", re.M)
+SUSPICIOUS_PROC_RE = re.compile(r"malware|mimikatz", re.I)
+DEFAULT_IOC_RE = re.compile("|".join(map(re.escape, DEFAULT_IOCS)), re.I)
+
+# swapped for a script reader by --script, which also hides the menu banners
+input_fn = input
+scripted = False
+
+# dump sections and the rows parsed from them, dropped when the dump's mtime changes
+_SECTIONS_CACHE = None
+_SECTIONS_MTIME = None
+_PARSED_CACHE = {}
+
 
 def create_sample_memory_dump():
     if os.path.exists(MEMORY_DUMP_PATH):
         return
-    content = textwrap.dedent("""\
-    # SIMPLE RAM DUMP SIMULATION
-    [METADATA]
-    capture_time=2025-11-12 10:20:30
-    os=Windows 10 x64
-    profile=Win10x64
-
-    [PROCESSES]
-    PID,PPID,NAME,USER,PATH
-    4,0,System,SYSTEM,C:\\Windows\\System32\\ntoskrnl.exe
-    312,4,smss.exe,SYSTEM,C:\\Windows\\System32\\smss.exe
-    528,528,csrss.exe,SYSTEM,C:\\Windows\\System32\\csrss.exe
-    612,528,wininit.exe,SYSTEM,C:\\Windows\\System32\\wininit.exe
-    720,612,services.exe,SYSTEM,C:\\Windows\\System32\\services.exe
-    800,612,lsass.exe,SYSTEM,C:\\Windows\\System32\\lsass.exe
-    1400,720,svchost.exe,LOCAL SERVICE,C:\\Windows\\System32\\svchost.exe
-    1500,720,svchost.exe,NETWORK SERVICE,C:\\Windows\\System32\\svchost.exe
-    2000,720,chrome.exe,User,C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe
-    2100,720,chrome.exe,User,C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe
-    2500,720,unknown_malware.exe,User,C:\\Users\\User\\AppData\\Roaming\\evil\\unknown_malware.exe
-
-    [NETWORK]
-    LADDR,LPORT,RADDR,RPORT,PROTO,PID,STATE
-    192.168.1.10,49200,142.250.71.238,443,TCP,2000,ESTABLISHED
-    192.168.1.10,49201,142.250.71.238,443,TCP,2100,ESTABLISHED
-    192.168.1.10,50000,185.203.113.55,4444,TCP,2500,ESTABLISHED
-    192.168.1.10,53,8.8.8.8,53,UDP,720,OPEN
-    192.168.1.10,137,0.0.0.0,0,UDP,720,LISTEN
-
-    [STRINGS]
-    "C2_SERVER=185.203.113.55"
-    "Mimikatz was here"
-    "Password=SuperSecret123"
-    "malware payload injected"
-    """)
-    with open(MEMORY_DUMP_PATH, "w", encoding="utf-8") as f:
-        f.write(content)
+    fd = os.open(MEMORY_DUMP_PATH, SAMPLE_OPEN_FLAGS, 0o644)
+    try:
+        data = SAMPLE_MEMORY_DUMP
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
-def load_section(section_name):
+def _load_all_sections():
+    global _SECTIONS_CACHE, _SECTIONS_MTIME
     if not os.path.exists(MEMORY_DUMP_PATH):
         create_sample_memory_dump()
 
-    data = []
-    current_section = None
-    with open(MEMORY_DUMP_PATH, encoding="utf-8") as f:
-        for line in f:
-            line = line.rstrip("\n")
-            if line.startswith("[") and line.endswith("]"):
-                current_section = line.strip("[]")
-                continue
-            if current_section == section_name and line and not line.startswith("#"):
-                data.append(line)
-    return data
+    mtime = os.stat(MEMORY_DUMP_PATH).st_mtime_ns
+    if _SECTIONS_CACHE is not None and mtime == _SECTIONS_MTIME:
+        return _SECTIONS_CACHE
 
+    sections = {}
+    with open(MEMORY_DUMP_PATH, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            # map the dump and copy out one section body at a time
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                headers = [(m.group(1), m.start(), m.end()) for m in SECTION_HEADER_RE.finditer(mm)]
+                ends = [start for _, start, _ in headers[1:]] + [len(mm)]
+                for (name, _, body_start), body_end in zip(headers, ends):
+                    lines = sections.setdefault(name.strip(b"[]").decode("utf-8"), [])
+                    lines.extend(ln.decode("utf-8") for ln in mm[body_start:body_end].splitlines()
+                                 if ln and not ln.startswith(b"#"))
 
-def parse_processes():
-    lines = load_section("PROCESSES")
+    _SECTIONS_CACHE = sections
+    _SECTIONS_MTIME = mtime
+    _PARSED_CACHE.clear()
+    return sections
+
+
+def load_section(section_name):
+    return _load_all_sections().get(section_name, [])
+
+
+def _cached_rows(section_name, parse, key=None):
+    sections = _load_all_sections()
+    key = key or section_name
+    rows = _PARSED_CACHE.get(key)
+    if rows is None:
+        rows = _PARSED_CACHE[key] = parse(sections.get(section_name, []))
+    return rows
+
+
+def _split_csv_lines(lines, columns):
     if not lines:
-        return []
+        return
 
     header = lines[0].split(",")
-    processes = []
+    width = len(header)
+    # pick the wanted columns by their position in the dump's header; missing ones read as ""
+    pick = itemgetter(*(header.index(col) if col in header else width for col in columns))
     for line in lines[1:]:
         parts = line.split(",")
-        if len(parts) != len(header):
+        if len(parts) != width:
             continue
-        proc = dict(zip(header, parts))
-        processes.append(proc)
-    return processes
+        parts.append("")
+        yield pick(parts)
+
+
+def _parse_process_lines(lines):
+    # USER has only a handful of distinct values, so rows share interned copies
+    intern = sys.intern
+    return [Process(pid, ppid, name, intern(user), path, name.lower())
+            for pid, ppid, name, user, path in _split_csv_lines(lines, PROCESS_COLUMNS)]
+
+
+def parse_processes():
+    return _cached_rows("PROCESSES", _parse_process_lines)
+
+
+def _port_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_connection_lines(lines):
+    # convert the ports once here instead of in every filter; PROTO/STATE are interned
+    intern = sys.intern
+    return [Connection(laddr, lport, raddr, rport, intern(proto), pid, intern(state),
+                       _port_int(lport), _port_int(rport))
+            for laddr, lport, raddr, rport, proto, pid, state
+            in _split_csv_lines(lines, CONNECTION_COLUMNS)]
 
 
 def parse_connections():
-    lines = load_section("NETWORK")
-    if not lines:
-        return []
+    return _cached_rows("NETWORK", _parse_connection_lines)
 
-    header = lines[0].split(",")
-    conns = []
-    for line in lines[1:]:
-        parts = line.split(",")
-        if len(parts) != len(header):
-            continue
-        conns.append(dict(zip(header, parts)))
-    return conns
+
+def _parse_string_lines(lines):
+    texts = [l.strip().strip('"') for l in lines if l.strip()]
+    return [DumpString(t, t.lower()) for t in texts]
 
 
 def parse_strings():
-    lines = load_section("STRINGS")
-    return [l.strip().strip('"') for l in lines if l.strip()]
+    return _cached_rows("STRINGS", _parse_string_lines)
+
+
+def _pack_string_lines(lines):
+    # all lowercased strings in one newline-joined blob, plus where each one starts
+    lowered = [s.text_lc for s in _parse_string_lines(lines)]
+    starts = [0]
+    for s in lowered:
+        starts.append(starts[-1] + len(s) + 1)
+    return "\n".join(lowered), starts
+
+
+def search_strings(keyword):
+    strings = parse_strings()
+    keyword = keyword.lower()
+    if not keyword:
+        return list(strings)
+
+    blob, starts = _cached_rows("STRINGS", _pack_string_lines, key="STRINGS_BLOB")
+    hits = []
+    pos = blob.find(keyword)
+    while pos != -1:
+        i = bisect_right(starts, pos) - 1
+        hits.append(strings[i])
+        pos = blob.find(keyword, starts[i + 1])
+    return hits
+
+
+def show_menu(title, options):
+    if not scripted:
+        print(f"\n{title}:")
+        print("\n".join(options))
 
 
 def pretty_print_table(rows, columns):
@@ -111,16 +221,14 @@ def pretty_print_table(rows, columns):
         print("No data found.")
         return
 
-    widths = {col: len(col) for col in columns}
-    for row in rows:
-        for col in columns:
-            widths[col] = max(widths[col], len(str(row.get(col, ""))))
-
-    line = " | ".join(col.ljust(widths[col]) for col in columns)
-    print(line)
-    print("-" * len(line))
-    for row in rows:
-        print(" | ".join(str(row.get(col, "")).ljust(widths[col]) for col in columns))
+    # stringify each column once, then size and format from those values
+    cells = [[str(getattr(row, col, "")) for row in rows] for col in columns]
+    widths = [max(len(col), max(map(len, values))) for col, values in zip(columns, cells)]
+    fmt = " | ".join(f"{{:<{w}}}" for w in widths).format
+    header = fmt(*columns)
+    lines = [header, "-" * len(header)]
+    lines.extend(fmt(*values) for values in zip(*cells))
+    print("\n".join(lines))
 
 
 def menu_list_processes():
@@ -130,28 +238,27 @@ def menu_list_processes():
         return
 
     while True:
-        print("\nProcess Menu:")
-        print("1) Show all processes")
-        print("2) Filter by process name")
-        print("3) Filter by PID")
-        print("4) Show suspicious (contains 'malware' or 'mimikatz')")
-        print("0) Back")
-        choice = input("Choose an option: ").strip()
+        show_menu("Process Menu", (
+            "1) Show all processes",
+            "2) Filter by process name",
+            "3) Filter by PID",
+            "4) Show suspicious (contains 'malware' or 'mimikatz')",
+            "0) Back"))
+        choice = input_fn("Choose an option: ").strip()
 
         if choice == "1":
-            pretty_print_table(processes, ["PID", "PPID", "NAME", "USER", "PATH"])
+            pretty_print_table(processes, PROCESS_COLUMNS)
         elif choice == "2":
-            name = input("Enter (part of) process name to search: ").strip().lower()
-            filtered = [p for p in processes if name in p["NAME"].lower()]
-            pretty_print_table(filtered, ["PID", "PPID", "NAME", "USER", "PATH"])
+            name = input_fn("Enter (part of) process name to search: ").strip().lower()
+            filtered = [p for p in processes if name in p.name_lc]
+            pretty_print_table(filtered, PROCESS_COLUMNS)
         elif choice == "3":
-            pid = input("Enter PID to search: ").strip()
-            filtered = [p for p in processes if p["PID"] == pid]
-            pretty_print_table(filtered, ["PID", "PPID", "NAME", "USER", "PATH"])
+            pid = input_fn("Enter PID to search: ").strip()
+            filtered = [p for p in processes if p.PID == pid]
+            pretty_print_table(filtered, PROCESS_COLUMNS)
         elif choice == "4":
-            keywords = ["malware", "mimikatz"]
-            filtered = [p for p in processes if any(k in p["NAME"].lower() for k in keywords)]
-            pretty_print_table(filtered, ["PID", "PPID", "NAME", "USER", "PATH"])
+            filtered = [p for p in processes if SUSPICIOUS_PROC_RE.search(p.NAME)]
+            pretty_print_table(filtered, PROCESS_COLUMNS)
         elif choice == "0":
             break
         else:
@@ -165,34 +272,29 @@ def menu_list_connections():
         return
 
     while True:
-        print("\nNetwork Menu:")
-        print("1) Show all connections")
-        print("2) Filter by remote IP")
-        print("3) Filter by port")
-        print("4) Show suspicious ports (>1024 and not 80/443)")
-        print("0) Back")
-        choice = input("Choose an option: ").strip()
+        show_menu("Network Menu", (
+            "1) Show all connections",
+            "2) Filter by remote IP",
+            "3) Filter by port",
+            "4) Show suspicious ports (>1024 and not 80/443)",
+            "0) Back"))
+        choice = input_fn("Choose an option: ").strip()
 
         if choice == "1":
-            pretty_print_table(conns, ["LADDR", "LPORT", "RADDR", "RPORT", "PROTO", "PID", "STATE"])
+            pretty_print_table(conns, CONNECTION_COLUMNS)
         elif choice == "2":
-            ip = input("Enter (part of) remote IP: ").strip()
-            filtered = [c for c in conns if ip in c["RADDR"]]
-            pretty_print_table(filtered, ["LADDR", "LPORT", "RADDR", "RPORT", "PROTO", "PID", "STATE"])
+            ip = input_fn("Enter (part of) remote IP: ").strip()
+            filtered = [c for c in conns if ip in c.RADDR]
+            pretty_print_table(filtered, CONNECTION_COLUMNS)
         elif choice == "3":
-            port = input("Enter port to search (local or remote): ").strip()
-            filtered = [c for c in conns if c["LPORT"] == port or c["RPORT"] == port]
-            pretty_print_table(filtered, ["LADDR", "LPORT", "RADDR", "RPORT", "PROTO", "PID", "STATE"])
+            port = _port_int(input_fn("Enter port to search (local or remote): ").strip())
+            filtered = [c for c in conns
+                        if port is not None and port in (c.lport_int, c.rport_int)]
+            pretty_print_table(filtered, CONNECTION_COLUMNS)
         elif choice == "4":
-            filtered = []
-            for c in conns:
-                try:
-                    rp = int(c["RPORT"])
-                except ValueError:
-                    continue
-                if rp > 1024 and rp not in (80, 443):
-                    filtered.append(c)
-            pretty_print_table(filtered, ["LADDR", "LPORT", "RADDR", "RPORT", "PROTO", "PID", "STATE"])
+            filtered = [c for c in conns
+                        if (rp := c.rport_int) is not None and rp > 1024 and rp not in (80, 443)]
+            pretty_print_table(filtered, CONNECTION_COLUMNS)
         elif choice == "0":
             break
         else:
@@ -206,27 +308,25 @@ def menu_search_strings():
         return
 
     while True:
-        print("\nString / IOC Search:")
-        print("1) Show all strings")
-        print("2) Search for a keyword")
-        print("3) Search using common malware keywords")
-        print("0) Back")
-        choice = input("Choose an option: ").strip()
+        show_menu("String / IOC Search", (
+            "1) Show all strings",
+            "2) Search for a keyword",
+            "3) Search using common malware keywords",
+            "0) Back"))
+        choice = input_fn("Choose an option: ").strip()
 
         if choice == "1":
             for s in strings:
-                print(s)
+                print(s.text)
         elif choice == "2":
-            kw = input("Enter keyword: ").strip().lower()
-            for s in strings:
-                if kw in s.lower():
-                    print(s)
+            kw = input_fn("Enter keyword: ").strip()
+            for s in search_strings(kw):
+                print(s.text)
         elif choice == "3":
-            default_iocs = ["mimikatz", "payload", "C2_SERVER", "Password"]
-            print("Using default IOCs:", ", ".join(default_iocs))
+            print("Using default IOCs:", ", ".join(DEFAULT_IOCS))
             for s in strings:
-                if any(k.lower() in s.lower() for k in default_iocs):
-                    print("[HIT]", s)
+                if DEFAULT_IOC_RE.search(s.text):
+                    print("[HIT]", s.text)
         elif choice == "0":
             break
         else:
@@ -234,76 +334,104 @@ def menu_search_strings():
 
 
 def generate_report():
-    case_id = input("Enter Case ID for the report: ").strip() or "CASE_RAM_DEMO"
-    examiner = input("Enter Examiner Name: ").strip() or "Examiner"
-    report_name = f"{case_id}_ram_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-    report_path = os.path.join(REPORTS_DIR, report_name)
+    case_id = input_fn("Enter Case ID for the report: ").strip() or "CASE_RAM_DEMO"
+    examiner = input_fn("Enter Examiner Name: ").strip() or "Examiner"
+    now = datetime.now()
+    report_path = os.path.join(REPORTS_DIR, f"{case_id}_ram_report_{now:%Y%m%d_%H%M%S}.txt")
 
     processes = parse_processes()
     conns = parse_connections()
     strings = parse_strings()
 
-    suspicious_procs = [p for p in processes if "malware" in p["NAME"].lower()]
-    suspicious_conns = []
-    for c in conns:
-        try:
-            rp = int(c["RPORT"])
-        except ValueError:
-            continue
-        if rp > 1024 and rp not in (80, 443):
-            suspicious_conns.append(c)
-
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write(f"RAM ANALYSIS REPORT - {case_id}\n")
-        f.write(f"Examiner: {examiner}\n")
-        f.write(f"Generated: {datetime.now()}\n\n")
-
-        f.write("Suspicious Processes:\n")
-        for p in suspicious_procs:
-            f.write(f"- PID {p['PID']} NAME {p['NAME']} PATH {p['PATH']}\n")
-        if not suspicious_procs:
-            f.write("- None detected by simple rules\n")
-        f.write("\nSuspicious Connections:\n")
-        for c in suspicious_conns:
-            f.write(f"- {c['LADDR']}:{c['LPORT']} -> {c['RADDR']}:{c['RPORT']} PID {c['PID']}\n")
-        if not suspicious_conns:
-            f.write("- None detected by simple rules\n")
-
-        f.write("\nInteresting Strings (containing 'password' or 'C2'):\n")
-        for s in strings:
-            if "password" in s.lower() or "c2" in s.lower():
-                f.write(f"- {s}\n")
+    suspicious_procs = [p for p in processes if "malware" in p.name_lc]
+    suspicious_conns = [c for c in conns
+                        if (rp := c.rport_int) is not None and rp > 1024 and rp not in (80, 443)]
+
+    parts = [f"RAM ANALYSIS REPORT - {case_id}\n",
+             f"Examiner: {examiner}\n",
+             f"Generated: {now}\n\n",
+             "Suspicious Processes:\n"]
+    parts.extend(f"- PID {p.PID} NAME {p.NAME} PATH {p.PATH}\n" for p in suspicious_procs)
+    if not suspicious_procs:
+        parts.append("- None detected by simple rules\n")
+    parts.append("\nSuspicious Connections:\n")
+    parts.extend(f"- {c.LADDR}:{c.LPORT} -> {c.RADDR}:{c.RPORT} PID {c.PID}\n" for c in suspicious_conns)
+    if not suspicious_conns:
+        parts.append("- None detected by simple rules\n")
+
+    parts.append("\nInteresting Strings (containing 'password' or 'C2'):\n")
+    parts.extend(f"- {s.text}\n" for s in strings if "password" in s.text_lc or "c2" in s.text_lc)
+
+    with open(report_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("".join(parts))
 
     print(f"\nReport generated: {report_path}")
 
 
-def main():
-    create_sample_memory_dump()
-    while True:
-        print("\nMain Menu:")
-        print("1) View / analyze process list")
-        print("2) View / analyze network connections")
-        print("3) Search for strings / IOCs")
-        print("4) Generate simple forensic report")
-        print("5) Show path of sample memory dump")
-        print("0) Exit")
-        choice = input("Enter your choice: ").strip()
+def show_dump_path():
+    print(f"Sample memory dump located at: {MEMORY_DUMP_PATH}")
 
-        if choice == "1":
-            menu_list_processes()
-        elif choice == "2":
-            menu_list_connections()
-        elif choice == "3":
-            menu_search_strings()
-        elif choice == "4":
-            generate_report()
-        elif choice == "5":
-            print(f"Sample memory dump located at: {MEMORY_DUMP_PATH}")
-        elif choice == "0":
+
+ACTIONS = {
+    "1": menu_list_processes,
+    "2": menu_list_connections,
+    "3": menu_search_strings,
+    "4": generate_report,
+    "5": show_dump_path,
+}
+
+
+def script_reader(path):
+    with open(path, encoding="utf-8") as f:
+        commands = iter(f.read().splitlines())
+
+    def read(prompt=""):
+        try:
+            return next(commands)
+        except StopIteration:
+            raise EOFError from None
+    return read
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="RAM dump analysis tool")
+    ap.add_argument("--script",
+                    help="file with one menu answer per line, run instead of prompting")
+    return ap.parse_args(argv)
+
+
+def run_menu():
+    while True:
+        show_menu("Main Menu", (
+            "1) View / analyze process list",
+            "2) View / analyze network connections",
+            "3) Search for strings / IOCs",
+            "4) Generate simple forensic report",
+            "5) Show path of sample memory dump",
+            "0) Exit"))
+        choice = input_fn("Enter your choice: ").strip()
+        if choice == "0":
             break
+        action = ACTIONS.get(choice)
+        if action:
+            action()
         else:
             print("Invalid choice, please try again.")
 
 
+def main(argv=None):
+    global input_fn, scripted
+    args = parse_args(argv)
+    if args.script:
+        input_fn = script_reader(args.script)
+        scripted = True
+
+    create_sample_memory_dump()
+    try:
+        run_menu()
+    except EOFError:
+        pass
+
+
 if __name__ == "__main__":
     main()
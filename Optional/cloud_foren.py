@@ -11,73 +11,102 @@ os.makedirs(REPORTS_DIR, exist_ok=True)
 
 CLOUD_EXPORT = os.path.join(SAMPLE_DIR, "cloud_export.json")
 
+SAMPLE_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+SAMPLE_CLOUD_EXPORT = {
+    "service": "Google Drive",
+    "account_email": "suspect@example.com",
+    "files": [
+        {
+            "id": "1",
+            "name": "ProjectPlan.docx",
+            "path": "/Work/ProjectPlan.docx",
+            "size_bytes": 20480,
+            "owner": "suspect@example.com",
+            "shared_with": ["colleague@example.com"],
+            "deleted": False,
+            "created": "2025-11-01 10:00:00",
+            "modified": "2025-11-10 12:00:00"
+        },
+        {
+            "id": "2",
+            "name": "Secrets.txt",
+            "path": "/Hidden/Secrets.txt",
+            "size_bytes": 1024,
+            "owner": "suspect@example.com",
+            "shared_with": ["external@malicious.com"],
+            "deleted": False,
+            "created": "2025-11-05 09:00:00",
+            "modified": "2025-11-10 15:00:00"
+        },
+        {
+            "id": "3",
+            "name": "DeletedEvidence.zip",
+            "path": "/Trash/DeletedEvidence.zip",
+            "size_bytes": 5096,
+            "owner": "suspect@example.com",
+            "shared_with": [],
+            "deleted": True,
+            "created": "2025-10-20 08:00:00",
+            "modified": "2025-10-21 09:00:00"
+        }
+    ],
+    "access_logs": [
+        {"timestamp": "2025-11-10 15:05:00", "ip": "203.45.67.89",
+         "country": "Unknown", "action": "DOWNLOAD", "file_id": "2"},
+        {"timestamp": "2025-11-10 15:06:00", "ip": "192.168.1.10",
+         "country": "Local", "action": "VIEW", "file_id": "1"},
+        {"timestamp": "2025-11-09 11:00:00", "ip": "203.45.67.89",
+         "country": "Unknown", "action": "LOGIN", "file_id": None},
+    ]
+}
+
 
 def create_sample_cloud_export():
     if os.path.exists(CLOUD_EXPORT):
         return
 
-    export = {
-        "service": "Google Drive",
-        "account_email": "suspect@example.com",
-        "files": [
-            {
-                "id": "1",
-                "name": "ProjectPlan.docx",
-                "path": "/Work/ProjectPlan.docx",
-                "size_bytes": 20480,
-                "owner": "suspect@example.com",
-                "shared_with": ["colleague@example.com"],
-                "deleted": False,
-                "created": "2025-11-01 10:00:00",
-                "modified": "2025-11-10 12:00:00"
-            },
-            {
-                "id": "2",
-                "name": "Secrets.txt",
-                "path": "/Hidden/Secrets.txt",
-                "size_bytes": 1024,
-                "owner": "suspect@example.com",
-                "shared_with": ["external@malicious.com"],
-                "deleted": False,
-                "created": "2025-11-05 09:00:00",
-                "modified": "2025-11-10 15:00:00"
-            },
-            {
-                "id": "3",
-                "name": "DeletedEvidence.zip",
-                "path": "/Trash/DeletedEvidence.zip",
-                "size_bytes": 5096,
-                "owner": "suspect@example.com",
-                "shared_with": [],
-                "deleted": True,
-                "created": "2025-10-20 08:00:00",
-                "modified": "2025-10-21 09:00:00"
-            }
-        ],
-        "access_logs": [
-            {"timestamp": "2025-11-10 15:05:00", "ip": "203.45.67.89",
-             "country": "Unknown", "action": "DOWNLOAD", "file_id": "2"},
-            {"timestamp": "2025-11-10 15:06:00", "ip": "192.168.1.10",
-             "country": "Local", "action": "VIEW", "file_id": "1"},
-            {"timestamp": "2025-11-09 11:00:00", "ip": "203.45.67.89",
-             "country": "Unknown", "action": "LOGIN", "file_id": None},
-        ]
-    }
-    with open(CLOUD_EXPORT, "w", encoding="utf-8") as f:
-        json.dump(export, f, indent=4)
+    fd = os.open(CLOUD_EXPORT, SAMPLE_OPEN_FLAGS, 0o644)
+    try:
+        data = json.dumps(SAMPLE_CLOUD_EXPORT, indent=4).encode("utf-8")
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def load_export(path=None):
     if path is None:
         create_sample_cloud_export()
         path = CLOUD_EXPORT
-    with open(path, encoding="utf-8") as f:
-        return json.load(f), path
+    with open(path, "rb") as f:
+        data = json.loads(f.read())
+    index_export(data)
+    return data, path
+
+
+def index_export(data):
+    files = data.get("files", [])
+    # file_id -> file record, so access logs resolve their file without a scan
+    data["_files_by_id"] = {f["id"]: f for f in files}
+    data["_files_lc"] = [(f["name"].lower(), f["path"].lower(), f) for f in files]
+    data["_deleted_files"] = [f for f in files if f["deleted"]]
+    data["_shared_files"] = [f for f in files if f["shared_with"]]
+    logs_by_ip = {}
+    for log in data.get("access_logs", []):
+        logs_by_ip.setdefault(log["ip"], []).append(log)
+    data["_logs_by_ip"] = logs_by_ip
 
 
 def list_files(data, filter_deleted=None, only_shared=None):
     print("\nCloud files:")
-    for f in data.get("files", []):
+    if filter_deleted:
+        files = data["_deleted_files"]
+    elif only_shared:
+        files = data["_shared_files"]
+    else:
+        files = data.get("files", [])
+    for f in files:
         if filter_deleted is not None and f["deleted"] != filter_deleted:
             continue
         if only_shared and not f["shared_with"]:
@@ -91,25 +120,21 @@ def list_files(data, filter_deleted=None, only_shared=None):
 def search_files(data):
     keyword = input("Enter keyword (name/path) or extension (e.g., .txt): ").strip().lower()
     print("\nSearch results:")
-    for f in data.get("files", []):
-        if keyword in f["name"].lower() or keyword in f["path"].lower():
+    for name_lc, path_lc, f in data["_files_lc"]:
+        if keyword in name_lc or keyword in path_lc:
             print(f"{f['id']}: {f['path']} - owner={f['owner']}, deleted={f['deleted']}")
 
 
 def view_access_logs(data):
     print("\nAccess logs:")
     suspicious_ip = input("Mark any IP as suspicious (e.g., 203.45.67.89) or leave blank: ").strip()
+    files_by_id = data["_files_by_id"]
     for log in data.get("access_logs", []):
         flag = ""
         if suspicious_ip and log["ip"] == suspicious_ip:
             flag = " [SUSPICIOUS]"
-        file_id = log.get("file_id")
-        file_name = ""
-        if file_id:
-            for f in data.get("files", []):
-                if f["id"] == file_id:
-                    file_name = f"{f['name']} "
-                    break
+        fobj = files_by_id.get(log.get("file_id"))
+        file_name = f"{fobj['name']} " if fobj else ""
         print(f"[{log['timestamp']}] {log['ip']} ({log['country']}){flag} "
               f"{log['action']} {file_name}".strip())
 
@@ -117,44 +142,37 @@ def view_access_logs(data):
 def generate_cloud_report(data, source_path):
     case_id = input("Enter Case ID: ").strip() or "CASE_CLOUD_DEMO"
     examiner = input("Enter Examiner: ").strip() or "Examiner"
-    report_name = f"{case_id}_cloud_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-    report_path = os.path.join(REPORTS_DIR, report_name)
+    now = datetime.now()
+    report_path = os.path.join(REPORTS_DIR, f"{case_id}_cloud_report_{now:%Y%m%d_%H%M%S}.txt")
 
     suspicious_ip = input("Enter known suspicious IP (leave blank if none): ").strip()
 
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write(f"CLOUD ANALYSIS REPORT - {case_id}\n")
-        f.write(f"Source Export: {source_path}\n")
-        f.write(f"Examiner: {examiner}\n")
-        f.write(f"Generated: {datetime.now()}\n\n")
-
-        f.write(f"Service: {data.get('service')}\n")
-        f.write(f"Account: {data.get('account_email')}\n\n")
-
-        files = data.get("files", [])
-        deleted = [fi for fi in files if fi["deleted"]]
-        shared = [fi for fi in files if fi["shared_with"]]
-
-        f.write(f"Total files: {len(files)}\n")
-        f.write(f"Deleted files: {len(deleted)}\n")
-        f.write(f"Shared files: {len(shared)}\n\n")
-
-        f.write("Shared Files:\n")
-        for fi in shared:
-            f.write(f"- {fi['path']} -> {', '.join(fi['shared_with'])}\n")
-
-        if suspicious_ip:
-            f.write(f"\nAccesses from suspicious IP {suspicious_ip}:\n")
-            for log in data.get("access_logs", []):
-                if log["ip"] == suspicious_ip:
-                    f_id = log.get("file_id")
-                    fname = ""
-                    if f_id:
-                        for fi in files:
-                            if fi["id"] == f_id:
-                                fname = fi["name"]
-                                break
-                    f.write(f"- [{log['timestamp']}] {log['action']} {fname}\n")
+    files = data.get("files", [])
+    deleted = data["_deleted_files"]
+    shared = data["_shared_files"]
+
+    parts = [f"CLOUD ANALYSIS REPORT - {case_id}\n",
+             f"Source Export: {source_path}\n",
+             f"Examiner: {examiner}\n",
+             f"Generated: {now}\n\n",
+             f"Service: {data.get('service')}\n",
+             f"Account: {data.get('account_email')}\n\n",
+             f"Total files: {len(files)}\n",
+             f"Deleted files: {len(deleted)}\n",
+             f"Shared files: {len(shared)}\n\n",
+             "Shared Files:\n"]
+    parts.extend(f"- {fi['path']} -> {', '.join(fi['shared_with'])}\n" for fi in shared)
+
+    if suspicious_ip:
+        parts.append(f"\nAccesses from suspicious IP {suspicious_ip}:\n")
+        files_by_id = data["_files_by_id"]
+        for log in data["_logs_by_ip"].get(suspicious_ip, []):
+            fi = files_by_id.get(log.get("file_id"))
+            fname = fi["name"] if fi else ""
+            parts.append(f"- [{log['timestamp']}] {log['action']} {fname}\n")
+
+    with open(report_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("".join(parts))
 
     print("Report saved at:", report_path)
 
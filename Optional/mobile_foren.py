@@ -1,4 +1,5 @@
 import os
+import sys
 import json
 from datetime import datetime
 
@@ -11,59 +12,85 @@ os.makedirs(REPORTS_DIR, exist_ok=True)
 
 BACKUP_PATH = os.path.join(SAMPLE_DIR, "mobile_backup.json")
 
+SAMPLE_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+SAMPLE_MOBILE_BACKUP = {
+    "device_info": {
+        "model": "Android DemoPhone X",
+        "imei": "123456789012345",
+        "owner": "User A"
+    },
+    "contacts": [
+        {"name": "Alice", "number": "+919876543210"},
+        {"name": "Bob", "number": "+911234567890"},
+        {"name": "Unknown", "number": "+918888888888"},
+    ],
+    "call_logs": [
+        {"number": "+919876543210", "type": "OUTGOING", "duration_sec": 300,
+         "timestamp": "2025-11-12 20:30:00"},
+        {"number": "+911234567890", "type": "INCOMING", "duration_sec": 120,
+         "timestamp": "2025-11-12 21:00:00"},
+        {"number": "+918888888888", "type": "MISSED", "duration_sec": 0,
+         "timestamp": "2025-11-12 22:00:00"},
+    ],
+    "sms": [
+        {"number": "+919876543210", "direction": "SENT",
+         "body": "Meet at 9 PM behind the lab.", "timestamp": "2025-11-12 18:00:00"},
+        {"number": "+918888888888", "direction": "RECEIVED",
+         "body": "Bring the documents and pen drive.", "timestamp": "2025-11-12 18:30:00"},
+    ],
+    "app_chats": [
+        {"app": "WhatsApp", "peer": "Alice", "direction": "SENT",
+         "body": "Did you delete the emails?", "timestamp": "2025-11-12 19:00:00"},
+        {"app": "WhatsApp", "peer": "Alice", "direction": "RECEIVED",
+         "body": "Yes, all traces removed.", "timestamp": "2025-11-12 19:05:00"},
+    ],
+    "locations": [
+        {"timestamp": "2025-11-12 21:00:00",
+         "lat": 12.9716, "lon": 77.5946, "place": "Bangalore Central"},
+        {"timestamp": "2025-11-12 22:00:00",
+         "lat": 12.2958, "lon": 76.6394, "place": "Mysore"},
+    ]
+}
+
 
 def create_sample_mobile_backup():
     if os.path.exists(BACKUP_PATH):
         return
 
-    sample_data = {
-        "device_info": {
-            "model": "Android DemoPhone X",
-            "imei": "123456789012345",
-            "owner": "User A"
-        },
-        "contacts": [
-            {"name": "Alice", "number": "+919876543210"},
-            {"name": "Bob", "number": "+911234567890"},
-            {"name": "Unknown", "number": "+918888888888"},
-        ],
-        "call_logs": [
-            {"number": "+919876543210", "type": "OUTGOING", "duration_sec": 300,
-             "timestamp": "2025-11-12 20:30:00"},
-            {"number": "+911234567890", "type": "INCOMING", "duration_sec": 120,
-             "timestamp": "2025-11-12 21:00:00"},
-            {"number": "+918888888888", "type": "MISSED", "duration_sec": 0,
-             "timestamp": "2025-11-12 22:00:00"},
-        ],
-        "sms": [
-            {"number": "+919876543210", "direction": "SENT",
-             "body": "Meet at 9 PM behind the lab.", "timestamp": "2025-11-12 18:00:00"},
-            {"number": "+918888888888", "direction": "RECEIVED",
-             "body": "Bring the documents and pen drive.", "timestamp": "2025-11-12 18:30:00"},
-        ],
-        "app_chats": [
-            {"app": "WhatsApp", "peer": "Alice", "direction": "SENT",
-             "body": "Did you delete the emails?", "timestamp": "2025-11-12 19:00:00"},
-            {"app": "WhatsApp", "peer": "Alice", "direction": "RECEIVED",
-             "body": "Yes, all traces removed.", "timestamp": "2025-11-12 19:05:00"},
-        ],
-        "locations": [
-            {"timestamp": "2025-11-12 21:00:00",
-             "lat": 12.9716, "lon": 77.5946, "place": "Bangalore Central"},
-            {"timestamp": "2025-11-12 22:00:00",
-             "lat": 12.2958, "lon": 76.6394, "place": "Mysore"},
-        ]
-    }
-    with open(BACKUP_PATH, "w", encoding="utf-8") as f:
-        json.dump(sample_data, f, indent=4)
+    fd = os.open(BACKUP_PATH, SAMPLE_OPEN_FLAGS, 0o644)
+    try:
+        data = json.dumps(SAMPLE_MOBILE_BACKUP, indent=4).encode("utf-8")
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def load_backup(path=None):
     if path is None:
         create_sample_mobile_backup()
         path = BACKUP_PATH
-    with open(path, encoding="utf-8") as f:
-        return json.load(f), path
+    with open(path, "rb") as f:
+        data = json.loads(f.read())
+    index_backup(data)
+    return data, path
+
+
+def index_backup(data):
+    # lowercase the searched fields once, intern the repeated labels and bucket chats by app
+    intern = sys.intern
+    for s in data.get("sms", []):
+        s["direction"] = intern(s["direction"])
+        s["_body_lc"] = s["body"].lower()
+    by_app = {}
+    for m in data.get("app_chats", []):
+        m["app"] = intern(m["app"])
+        m["direction"] = intern(m["direction"])
+        m["_app_lc"] = m["app"].lower()
+        m["_peer_lc"] = m["peer"].lower()
+        by_app.setdefault(m["_app_lc"], []).append(m)
+    data["_app_chats_by_app"] = by_app
 
 
 def print_contacts(data):
@@ -93,7 +120,7 @@ def print_sms(data):
     for s in data.get("sms", []):
         if target and target not in s["number"]:
             continue
-        if keyword and keyword not in s["body"].lower():
+        if keyword and keyword not in s["_body_lc"]:
             continue
         direction = "->" if s["direction"] == "SENT" else "<-"
         print(f"[{s['timestamp']}] {direction} {s['number']}: {s['body']}")
@@ -101,13 +128,21 @@ def print_sms(data):
 
 def print_app_chats(data):
     print("\nApp chats:")
-    app_filter = input("Filter by app name (e.g., WhatsApp) or leave blank: ").strip()
-    peer_filter = input("Filter by peer name (e.g., Alice) or leave blank: ").strip()
-
-    for m in data.get("app_chats", []):
-        if app_filter and app_filter.lower() not in m["app"].lower():
+    app_filter = input("Filter by app name (e.g., WhatsApp) or leave blank: ").strip().lower()
+    peer_filter = input("Filter by peer name (e.g., Alice) or leave blank: ").strip().lower()
+
+    chats = data.get("app_chats", [])
+    if app_filter:
+        apps = [app for app in data["_app_chats_by_app"] if app_filter in app]
+        # a single matching app keeps list order, so its bucket can be used directly
+        if len(apps) <= 1:
+            chats = data["_app_chats_by_app"][apps[0]] if apps else []
+            app_filter = ""
+
+    for m in chats:
+        if app_filter and app_filter not in m["_app_lc"]:
             continue
-        if peer_filter and peer_filter.lower() not in m["peer"].lower():
+        if peer_filter and peer_filter not in m["_peer_lc"]:
             continue
         arrow = "->" if m["direction"] == "SENT" else "<-"
         print(f"[{m['timestamp']}] {m['app']} {arrow} {m['peer']}: {m['body']}")
@@ -122,30 +157,27 @@ def print_locations(data):
 def generate_report(data, source_path):
     case_id = input("Enter Case ID: ").strip() or "CASE_MOBILE_DEMO"
     examiner = input("Enter Examiner Name: ").strip() or "Examiner"
-    report_name = f"{case_id}_mobile_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-    report_path = os.path.join(REPORTS_DIR, report_name)
-
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write(f"MOBILE ANALYSIS REPORT - {case_id}\n")
-        f.write(f"Source Backup: {source_path}\n")
-        f.write(f"Examiner: {examiner}\n")
-        f.write(f"Generated: {datetime.now()}\n\n")
-
-        f.write("Device Info:\n")
-        di = data.get("device_info", {})
-        for k, v in di.items():
-            f.write(f"  {k}: {v}\n")
-
-        f.write("\nTotal Contacts: " + str(len(data.get("contacts", []))) + "\n")
-        f.write("Total Call Logs: " + str(len(data.get("call_logs", []))) + "\n")
-        f.write("Total SMS: " + str(len(data.get("sms", []))) + "\n")
-        f.write("Total App Chats: " + str(len(data.get("app_chats", []))) + "\n")
-        f.write("Total Locations: " + str(len(data.get("locations", []))) + "\n\n")
-
-        f.write("Suspicious SMS (containing 'meet' or 'documents'):\n")
-        for s in data.get("sms", []):
-            if "meet" in s["body"].lower() or "document" in s["body"].lower():
-                f.write(f"- [{s['timestamp']}] {s['number']}: {s['body']}\n")
+    now = datetime.now()
+    report_path = os.path.join(REPORTS_DIR, f"{case_id}_mobile_report_{now:%Y%m%d_%H%M%S}.txt")
+
+    parts = [f"MOBILE ANALYSIS REPORT - {case_id}\n",
+             f"Source Backup: {source_path}\n",
+             f"Examiner: {examiner}\n",
+             f"Generated: {now}\n\n",
+             "Device Info:\n"]
+    parts.extend(f"  {k}: {v}\n" for k, v in data.get("device_info", {}).items())
+
+    parts.append(f"\nTotal Contacts: {len(data.get('contacts', []))}\n"
+                 f"Total Call Logs: {len(data.get('call_logs', []))}\n"
+                 f"Total SMS: {len(data.get('sms', []))}\n"
+                 f"Total App Chats: {len(data.get('app_chats', []))}\n"
+                 f"Total Locations: {len(data.get('locations', []))}\n\n"
+                 "Suspicious SMS (containing 'meet' or 'documents'):\n")
+    parts.extend(f"- [{s['timestamp']}] {s['number']}: {s['body']}\n" for s in data.get("sms", [])
+                 if "meet" in s["_body_lc"] or "document" in s["_body_lc"])
+
+    with open(report_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("".join(parts))
 
     print("Report saved at:", report_path)
 
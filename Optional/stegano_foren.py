@@ -11,14 +11,21 @@ os.makedirs(REPORTS_DIR, exist_ok=True)
 COVER_FILE = os.path.join(SAMPLE_DIR, "cover.bin")
 STEGO_FILE = os.path.join(SAMPLE_DIR, "stego.bin")
 TERMINATOR = "####END####"
+# maps every byte to the ASCII '0'/'1' of its least significant bit
+LSB_CHARS = bytes(0x30 | (b & 1) for b in range(256))
+# maps every byte to its least significant bit as a 0/1 byte
+LSB_BITS = bytes(b & 1 for b in range(256))
+# maps every byte to itself with the least significant bit cleared
+CLEAR_LSB = bytes(b & 0xFE for b in range(256))
+DETECT_CHUNK_SIZE = 1 << 20
 
 
 def create_sample_cover():
     if os.path.exists(COVER_FILE):
         return
-    data = bytearray()
-    for i in range(5000):
-        data.append((i * 73 + 31) % 256)
+    # (i * 73 + 31) % 256 repeats every 256 bytes: build one period and tile it
+    period = bytes((i * 73 + 31) % 256 for i in range(256))
+    data = (period * (5000 // 256 + 1))[:5000]
     with open(COVER_FILE, "wb") as f:
         f.write(data)
 
@@ -27,16 +34,6 @@ def text_to_bits(text):
     return "".join(f"{ord(c):08b}" for c in text)
 
 
-def bits_to_text(bits):
-    chars = []
-    for i in range(0, len(bits), 8):
-        byte = bits[i:i + 8]
-        if len(byte) < 8:
-            break
-        chars.append(chr(int(byte, 2)))
-    return "".join(chars)
-
-
 def embed_message(cover_path, out_path, message):
     with open(cover_path, "rb") as f:
         data = bytearray(f.read())
@@ -47,29 +44,34 @@ def embed_message(cover_path, out_path, message):
     if len(bits) > len(data):
         raise ValueError("Cover file too small for this message.")
 
-    for i, b in enumerate(bits):
-        data[i] = (data[i] & 0b11111110) | int(b)
+    # clear the low bit of the first n cover bytes and turn the ASCII '0'/'1' bit string
+    # into 0/1 bytes with translate, then OR the two regions as integers in one step
+    n = len(bits)
+    cover = int.from_bytes(data[:n].translate(CLEAR_LSB), "little")
+    payload = int.from_bytes(bits.encode("ascii").translate(LSB_BITS), "little")
+    data[:n] = (cover | payload).to_bytes(n, "little")
 
     with open(out_path, "wb") as f:
         f.write(data)
 
 
 def detect_stego(path):
+    # stream the file in fixed-size chunks; each chunk is reduced to its LSBs with
+    # translate and popcounted as one big integer
+    total = 0
+    ones = 0
     with open(path, "rb") as f:
-        data = f.read()
-
-    if not data:
+        while True:
+            chunk = f.read(DETECT_CHUNK_SIZE)
+            if not chunk:
+                break
+            ones += int.from_bytes(chunk.translate(LSB_BITS), "little").bit_count()
+            total += len(chunk)
+
+    if not total:
         return 0.0, 0.0
 
-    ones = 0
-    zeros = 0
-    for b in data:
-        if b & 1:
-            ones += 1
-        else:
-            zeros += 1
-    total = ones + zeros
-    ratio = ones / total if total else 0
+    ratio = ones / total
 
     score = 1.0 - abs(0.5 - ratio) * 10
     score = max(0.0, min(score, 1.0))
@@ -78,15 +80,12 @@ def detect_stego(path):
 
 def extract_message(path, max_chars=5000):
     with open(path, "rb") as f:
-        data = f.read()
-
-    bits = []
-    for b in data:
-        bits.append(str(b & 1))
-        if len(bits) >= max_chars * 8:
-            break
+        data = f.read(max_chars * 8)
 
-    text = bits_to_text("".join(bits))
+    # one LSB per byte, packed back into 8-bit characters through a single base-2 int
+    nbytes = len(data) // 8
+    bits = data[:nbytes * 8].translate(LSB_CHARS)
+    text = int(bits, 2).to_bytes(nbytes, "big").decode("latin-1") if nbytes else ""
     end_idx = text.find(TERMINATOR)
     if end_idx == -1:
         return None
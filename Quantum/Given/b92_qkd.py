@@ -1,23 +1,31 @@
 import random
+from itertools import compress
+
+# turns the '0'/'1' digits of a binary string into 0/1 bytes
+BIT_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def random_bits(n):
+    return random.getrandbits(n) if n > 0 else 0
+
+
+def bits_to_list(value, n):
+    if n <= 0:
+        return []
+    return list(format(value, f"0{n}b").encode().translate(BIT_DIGITS))
 
 
 def simulate_b92(num_bits=200):
-    alice_bits = [random.randint(0, 1) for _ in range(num_bits)]
-    bob_bases = [random.choice(['Z', 'X']) for _ in range(num_bits)]
-    bob_results = []
-
-    for i in range(num_bits):
-        bit = alice_bits[i]
-        basis = bob_bases[i]
-        if bit == 0 and basis == 'Z':
-            meas = 0
-        elif bit == 1 and basis == 'X':
-            meas = 0
-        else:
-            meas = random.randint(0, 1)
-        bob_results.append(meas)
-
-    sifted_bits = [alice_bits[i] for i in range(num_bits) if bob_results[i] == 1]
+    # every per-bit choice is drawn at once as the bits of one integer (bases: 1 = X)
+    alice_bits = random_bits(num_bits)
+    bob_bases = random_bits(num_bits)
+    coin_flips = random_bits(num_bits)
+
+    # bit 0 measured in Z or bit 1 measured in X always reads 0; otherwise Bob gets a coin flip
+    bob_results = (alice_bits ^ bob_bases) & coin_flips
+
+    sifted_bits = list(compress(bits_to_list(alice_bits, num_bits),
+                                bits_to_list(bob_results, num_bits)))
     efficiency = (len(sifted_bits) / num_bits) * 100.0
     return len(sifted_bits), efficiency, sifted_bits
 
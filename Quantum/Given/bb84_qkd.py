@@ -1,42 +1,46 @@
 import random
+from itertools import compress
+
+# turns the '0'/'1' digits of a binary string into 0/1 bytes
+BIT_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def random_bits(n):
+    return random.getrandbits(n) if n > 0 else 0
+
+
+def bits_to_list(value, n):
+    if n <= 0:
+        return []
+    return list(format(value, f"0{n}b").encode().translate(BIT_DIGITS))
+
 
 def simulate_bb84(num_bits=50, eve=False):
-    alice_bits = [random.randint(0, 1) for _ in range(num_bits)]
-    alice_bases = [random.choice(['Z', 'X']) for _ in range(num_bits)]
-    bob_bases = [random.choice(['Z', 'X']) for _ in range(num_bits)]
-    bob_results = []
-
-    for i in range(num_bits):
-        bit = alice_bits[i]
-        a_basis = alice_bases[i]
-        b_basis = bob_bases[i]
-
-        # Eve intercept-resend (simple model)
-        if eve:
-            eve_basis = random.choice(['Z', 'X'])
-            if eve_basis != a_basis and random.random() < 0.5:
-                bit = 1 - bit
-
-        # Bob's measurement
-        if b_basis == a_basis:
-            received_bit = bit
-        else:
-            received_bit = random.randint(0, 1)
-
-        bob_results.append(received_bit)
+    # each per-bit choice is drawn at once as the bits of one integer (bases: 1 = X)
+    alice_bits = random_bits(num_bits)
+    alice_bases = random_bits(num_bits)
+    bob_bases = random_bits(num_bits)
+    all_ones = (1 << max(num_bits, 0)) - 1
+
+    # Eve intercept-resend (simple model): a wrong-basis guess flips the bit half the time
+    bits = alice_bits
+    if eve:
+        eve_bases = random_bits(num_bits)
+        bits ^= (eve_bases ^ alice_bases) & random_bits(num_bits)
+
+    # Bob's measurement: matching bases read the bit, the others a coin flip
+    same_basis = ~(alice_bases ^ bob_bases) & all_ones
+    bob_results = (bits & same_basis) | (random_bits(num_bits) & ~same_basis & all_ones)
 
     # Sifting
-    sifted_alice = []
-    sifted_bob = []
-    for i in range(num_bits):
-        if alice_bases[i] == bob_bases[i]:
-            sifted_alice.append(alice_bits[i])
-            sifted_bob.append(bob_results[i])
+    keep = bits_to_list(same_basis, num_bits)
+    sifted_alice = list(compress(bits_to_list(alice_bits, num_bits), keep))
+    sifted_bob = list(compress(bits_to_list(bob_results, num_bits), keep))
 
     if len(sifted_alice) == 0:
         error_rate = 0.0
     else:
-        errors = sum(1 for a, b in zip(sifted_alice, sifted_bob) if a != b)
+        errors = ((alice_bits ^ bob_results) & same_basis).bit_count()
         error_rate = (errors / len(sifted_alice)) * 100.0
 
     return {
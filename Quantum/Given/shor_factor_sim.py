@@ -1,10 +1,53 @@
 import random
-from math import gcd
+from math import gcd, isqrt
+
+# the baby-step giant-step order search below takes O(sqrt(N)) time and memory
+# (about 65k table entries and a few tens of ms at 2**32); past this size
+# Pollard's rho does the factoring
+ORDER_SEARCH_LIMIT = 1 << 32
+
+
+def find_order(a, N):
+    if gcd(a, N) != 1:
+        return 2 * N
+    # baby-step giant-step: r = i*m + j with a^j == a^(-i*m) (mod N), j in 1..m,
+    # so about 2*sqrt(N) multiplications instead of up to N
+    m = isqrt(N) + 1
+    baby = {}
+    x = 1
+    for j in range(1, m + 1):
+        x = x * a % N
+        baby.setdefault(x, j)
+    giant = pow(a, -m, N)
+    y = 1
+    for i in range(m + 1):
+        j = baby.get(y)
+        if j is not None:
+            return i * m + j
+        y = y * giant % N
+    return 2 * N
+
+
+def pollard_rho(N):
+    while True:
+        c = random.randint(1, N - 1)
+        x = y = random.randint(2, N - 1)
+        d = 1
+        while d == 1:
+            x = (x * x + c) % N
+            y = (y * y + c) % N
+            y = (y * y + c) % N
+            d = gcd(x - y, N)
+        if d != N:
+            return d
 
 
 def shors_sim(N):
     if N % 2 == 0:
         return 2, N // 2
+    if N > ORDER_SEARCH_LIMIT:
+        p = pollard_rho(N)
+        return p, N // p
 
     while True:
         a = random.randint(2, N - 1)
@@ -12,12 +55,7 @@ def shors_sim(N):
         if g > 1:
             return g, N // g
 
-        r = 1
-        while r < 2 * N:
-            if pow(a, r, N) == 1:
-                break
-            r += 1
-
+        r = find_order(a, N)
         if r % 2 != 0:
             continue
 
@@ -1,30 +1,39 @@
 import random
 import math
+from itertools import repeat, starmap
 
+# the two low bits of a random byte pick one trial's setting pair, as a*2 + b
+PAIR_OF_BYTE = bytes(b & 3 for b in range(256))
+# trials whose setting pairs are drawn per randbytes call
+CHSH_BLOCK = 1 << 20
+
+# measurement angles (theta_a, theta_b) of each setting pair, indexed by a*2 + b
+SETTING_KEYS = ('00', '01', '10', '11')
+SETTINGS = [
+    (0.0,  math.pi / 4),
+    (0.0, -math.pi / 4),
+    (math.pi / 2,  math.pi / 4),
+    (math.pi / 2, -math.pi / 4),
+]
+# quantum correlation E = -cos(theta_a - theta_b) and the matching P(outcome = +1)
+E_TABLE = [-math.cos(theta_a - theta_b) for theta_a, theta_b in SETTINGS]
+P_PLUS_TABLE = [(1 + e) / 2 for e in E_TABLE]
 
-def simulate_chsh(trials=1000):
-    settings = {
-        '00': (0.0,  math.pi / 4),
-        '01': (0.0, -math.pi / 4),
-        '10': (math.pi / 2,  math.pi / 4),
-        '11': (math.pi / 2, -math.pi / 4),
-    }
-    sums = {'00': 0.0, '01': 0.0, '10': 0.0, '11': 0.0}
-    counts = {'00': 0, '01': 0, '10': 0, '11': 0}
 
-    for _ in range(trials):
-        a = random.randint(0, 1)
-        b = random.randint(0, 1)
-        key = f"{a}{b}"
-        theta_a, theta_b = settings[key]
-        e = -math.cos(theta_a - theta_b)
-        outcome = 1 if random.random() < (1 + e) / 2 else -1
-        sums[key] += outcome
-        counts[key] += 1
+def simulate_chsh(trials=1000):
+    # tally the (a, b) pairs block by block so memory stays flat, then handle each
+    # pair's trials as one batch
+    counts = [0, 0, 0, 0]
+    for start in range(0, max(trials, 0), CHSH_BLOCK):
+        pairs = random.randbytes(min(CHSH_BLOCK, trials - start)).translate(PAIR_OF_BYTE)
+        for idx in range(4):
+            counts[idx] += pairs.count(idx)
+    # number of +1 outcomes: count draws of random() < P(+1), iterated in C
+    sums = [2 * sum(map(p_plus.__gt__, starmap(random.random, repeat((), count)))) - count
+            for p_plus, count in zip(P_PLUS_TABLE, counts)]
 
-    exp_values = {}
-    for key in sums:
-        exp_values[key] = 0.0 if counts[key] == 0 else sums[key] / counts[key]
+    exp_values = {key: 0.0 if count == 0 else total / count
+                  for key, total, count in zip(SETTING_KEYS, sums, counts)}
     S = abs(exp_values['00'] + exp_values['01'] + exp_values['10'] - exp_values['11'])
     return S, exp_values
 
@@ -20,24 +20,18 @@ class NTRULike:
         if len(msg_bits) != self.N:
             raise ValueError(f"Message must be length {self.N} bits.")
         start = time.time()
-        ct = []
-        half = self.q // 2
-        for b in msg_bits:
-            base = 0 if b == 0 else half
-            noise = random.randint(-self.noise_bound, self.noise_bound)
-            val = (base + noise) % self.q
-            ct.append(val)
+        q = self.q
+        half = q // 2
+        noise = random.choices(range(-self.noise_bound, self.noise_bound + 1), k=self.N)
+        ct = [((0 if b == 0 else half) + e) % q for b, e in zip(msg_bits, noise)]
         return ct, (time.time() - start) * 1000.0
 
     def decrypt(self, ct):
-        half = self.q // 2
-        decoded = []
-        for val in ct:
-            dist0 = min(val, self.q - val)
-            d1_raw = (val - half) % self.q
-            dist1 = min(d1_raw, self.q - d1_raw)
-            decoded.append(1 if dist1 < dist0 else 0)
-        return decoded
+        q = self.q
+        half = q // 2
+        # 1 when the value sits nearer q/2 than 0 (mod q)
+        return [1 if min(d1, q - d1) < min(v, q - v) else 0
+                for v in ct for d1 in ((v - half) % q,)]
 
 
 def main():
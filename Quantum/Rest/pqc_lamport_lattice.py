@@ -3,6 +3,13 @@ import time
 import random
 import hashlib
 
+# 256 secret values for each bit value, 32 bytes apiece
+KEY_BLOCK_SIZE = 32
+KEY_BLOCK_COUNT = 256
+
+# the eight bits of each byte value, most significant first, one 0/1 byte per bit
+BYTE_BITS = [bytes((b >> s) & 1 for s in range(7, -1, -1)) for b in range(256)]
+
 
 class LamportOTS:
     def __init__(self):
@@ -10,11 +17,11 @@ class LamportOTS:
         self.public_key = None
 
     def generate_keys(self):
-        zeros = []
-        ones = []
-        for _ in range(256):
-            zeros.append(os.urandom(32))
-            ones.append(os.urandom(32))
+        # one urandom call for the whole private key, sliced into 512 blocks
+        half = KEY_BLOCK_SIZE * KEY_BLOCK_COUNT
+        buf = os.urandom(2 * half)
+        zeros = [buf[i:i + KEY_BLOCK_SIZE] for i in range(0, half, KEY_BLOCK_SIZE)]
+        ones = [buf[i:i + KEY_BLOCK_SIZE] for i in range(half, 2 * half, KEY_BLOCK_SIZE)]
         self.private_key = {"zeros": zeros, "ones": ones}
         p_zeros = [hashlib.sha256(z).digest() for z in zeros]
         p_ones = [hashlib.sha256(o).digest() for o in ones]
@@ -22,21 +29,18 @@ class LamportOTS:
 
     def _message_to_bits(self, message_bytes):
         h = hashlib.sha256(message_bytes).digest()
-        value = int.from_bytes(h, "big")
-        return bin(value)[2:].zfill(256)
+        return b"".join(map(BYTE_BITS.__getitem__, h))
 
     def sign(self, message_bytes):
         bits = self._message_to_bits(message_bytes)
-        signature = []
-        for i, b in enumerate(bits):
-            signature.append(self.private_key["zeros"][i] if b == '0' else self.private_key["ones"][i])
-        return signature
+        keys = (self.private_key["zeros"], self.private_key["ones"])
+        return [keys[b][i] for i, b in enumerate(bits)]
 
     def verify(self, message_bytes, signature):
         bits = self._message_to_bits(message_bytes)
+        keys = (self.public_key["zeros"], self.public_key["ones"])
         for i, b in enumerate(bits):
-            expected = self.public_key["zeros"][i] if b == '0' else self.public_key["ones"][i]
-            if hashlib.sha256(signature[i]).digest() != expected:
+            if hashlib.sha256(signature[i]).digest() != keys[b][i]:
                 return False
         return True
 
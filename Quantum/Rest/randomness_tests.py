@@ -1,104 +1,155 @@
+import argparse
 import random
 import math
-
-
-def generate_bits(count):
-    return [random.randint(0, 1) for _ in range(count)]
+import sys
+from functools import lru_cache
+
+# one analysis result, rendered the same way on screen and in the observation table
+RESULT_TEMPLATE = (
+    "\n--- {label} ---\n"
+    "Total bits     : {total}\n"
+    "0s             : {zeros}\n"
+    "1s             : {ones}\n"
+    "Chi-squared    : {chi2:.4f}\n"
+    "Runs           : {runs}\n"
+    "Shannon entropy: {entropy:.4f} (ideal ≈ 1.0)"
+)
+# bits generated and analyzed per step of analyze_random_stream (64 KiB)
+STREAM_CHUNK_BITS = 1 << 19
+
+
+def frequency_from_count(ones, n):
+    zeros = n - ones
+    d = zeros - ones
+    # a perfectly balanced stream (and the empty one) needs no division
+    chi2 = 0.0 if d == 0 else d * d / n
+    return zeros, ones, chi2
 
 
 def frequency_test(bits):
-    n = len(bits)
-    zeros = bits.count(0)
-    ones = n - zeros
-    if n == 0:
-        return zeros, ones, 0.0
-    chi2 = float((zeros - ones) ** 2) / float(n)
-    return zeros, ones, chi2
+    # every element is a 0/1 byte, so the popcount of the buffer read as one integer
+    # is the number of ones
+    return frequency_from_count(int.from_bytes(bits, "little").bit_count(), len(bits))
 
 
 def runs_test(bits):
     if not bits:
         return 0
-    runs = 1
-    for i in range(1, len(bits)):
-        if bits[i] != bits[i - 1]:
-            runs += 1
-    return runs
+    # XOR the buffer with itself shifted one byte: byte i becomes bits[i] ^ bits[i + 1],
+    # so the popcount counts every transition, plus the last bit XORed with nothing
+    x = int.from_bytes(bits, "little")
+    return 1 + (x ^ (x >> 8)).bit_count() - bits[-1]
 
 
-def entropy(bits):
-    n = len(bits)
+@lru_cache(maxsize=4096)
+def entropy_from_count(ones, n):
     if n == 0:
         return 0.0
-    p0 = bits.count(0) / float(n)
+    p0 = (n - ones) / n
     p1 = 1.0 - p0
     h = 0.0
     for p in (p0, p1):
         if p > 0:
-            h -= p * math.log(p, 2)
+            h -= p * math.log2(p)
     return h
 
 
-def analyze_stream(bits, label):
-    zeros, ones, chi2 = frequency_test(bits)
-    r = runs_test(bits)
-    h = entropy(bits)
+def entropy(bits):
+    return entropy_from_count(int.from_bytes(bits, "little").bit_count(), len(bits))
+
+
+def analyze_counts(ones, transitions, n, label):
+    # every statistic follows from the ones count and the number of transitions
+    zeros, ones, chi2 = frequency_from_count(ones, n)
     return {
         "label": label,
-        "total": len(bits),
+        "total": n,
         "zeros": zeros,
         "ones": ones,
         "chi2": chi2,
-        "runs": r,
-        "entropy": h,
+        "runs": transitions + 1 if n else 0,
+        "entropy": entropy_from_count(ones, n),
     }
 
 
-def main():
-    print("=== Randomness Analysis (Frequency, Runs, Entropy) ===")
+def packed_counts(value, n):
+    # value holds the stream one bit per bit: ones is its popcount, and XOR with itself
+    # shifted one place, masked to the n - 1 adjacent pairs, marks every transition
+    if n <= 0:
+        return 0, 0
+    pairs_mask = (1 << (n - 1)) - 1
+    return value.bit_count(), ((value ^ (value >> 1)) & pairs_mask).bit_count()
+
+
+def analyze_random_stream(n, rng, label):
+    # draw and count the stream chunk by chunk so only one cache-sized chunk is live;
+    # a chunk's first bit is its top bit, so the pair across each boundary is the
+    # previous chunk's low bit against this chunk's top bit
+    ones = 0
+    transitions = 0
+    last_bit = None
+    for start in range(0, max(n, 0), STREAM_CHUNK_BITS):
+        size = min(STREAM_CHUNK_BITS, n - start)
+        value = rng.getrandbits(size)
+        chunk_ones, chunk_transitions = packed_counts(value, size)
+        ones += chunk_ones
+        transitions += chunk_transitions
+        if last_bit is not None:
+            transitions += last_bit ^ (value >> (size - 1))
+        last_bit = value & 1
+    return analyze_counts(ones, transitions, max(n, 0), label)
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Randomness analysis (frequency, runs, entropy)")
+    ap.add_argument("--bits", type=int,
+                    help="number of bits to generate, used instead of prompting")
+    ap.add_argument("--show", action="store_true",
+                    help="print the observation table without asking")
+    return ap.parse_args(argv)
+
+
+def prompt(text, default=""):
+    # batch runs with stdin closed or exhausted take the default instead of failing
     try:
-        n = int(input("Enter number of bits to generate (e.g., 1000): ").strip())
-    except ValueError:
-        n = 1000
-        print("Invalid input, using 1000 bits.")
-
-    random.seed()
-    bits_quantum = generate_bits(n)
-    random.seed(12345)
-    bits_classical = generate_bits(n)
-
-    res_q = analyze_stream(bits_quantum, "Simulated Quantum RNG")
-    res_c = analyze_stream(bits_classical, "Classical RNG (fixed seed)")
-
-    for res in (res_q, res_c):
-        print(f"\n--- {res['label']} ---")
-        print(f"Total bits     : {res['total']}")
-        print(f"0s             : {res['zeros']}")
-        print(f"1s             : {res['ones']}")
-        print(f"Chi-squared    : {res['chi2']:.4f}")
-        print(f"Runs           : {res['runs']}")
-        print(f"Shannon entropy: {res['entropy']:.4f} (ideal ≈ 1.0)")
-
-    print("\nInterpretation: Good randomness → 0s and 1s counts close, chi² small, entropy ≈ 1.")
+        return input(text).strip()
+    except EOFError:
+        return default
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print("=== Randomness Analysis (Frequency, Runs, Entropy) ===")
+    if args.bits is not None:
+        n = args.bits
+    else:
+        try:
+            n = int(prompt("Enter number of bits to generate (e.g., 1000): ", "1000"))
+        except ValueError:
+            n = 1000
+            print("Invalid input, using 1000 bits.")
+
+    # the "quantum" stream comes from OS entropy, the classical one from its own
+    # fixed-seed generator, leaving the global random state alone; both are generated
+    # and analyzed in chunks, so memory stays flat however many bits are asked for
+    res_q = analyze_random_stream(n, random.SystemRandom(), "Simulated Quantum RNG")
+    res_c = analyze_random_stream(n, random.Random(12345), "Classical RNG (fixed seed)")
+
+    result_blocks = [RESULT_TEMPLATE.format_map(res) for res in (res_q, res_c)]
+    report_lines = list(result_blocks)
+    report_lines.append("\nInterpretation: Good randomness → 0s and 1s counts close, chi² small, entropy ≈ 1.")
+    sys.stdout.write("\n".join(report_lines) + "\n")
 
     obs_lines = []
     obs_lines.append("Observation Table - Randomness Tests")
     obs_lines.append("--------------------------------------")
-    for res in (res_q, res_c):
-        obs_lines.append(f"\nSource              : {res['label']}")
-        obs_lines.append(f"Total bits          : {res['total']}")
-        obs_lines.append(f"0s                  : {res['zeros']}")
-        obs_lines.append(f"1s                  : {res['ones']}")
-        obs_lines.append(f"Chi-squared         : {res['chi2']:.4f}")
-        obs_lines.append(f"Runs                : {res['runs']}")
-        obs_lines.append(f"Shannon entropy     : {res['entropy']:.4f}")
+    obs_lines.extend(result_blocks)
     obs_text = "\n".join(obs_lines)
 
     with open("randomness_observation.txt", "w", encoding="utf-8") as f:
         f.write(obs_text)
 
-    show = input("\nDisplay observation table? [y/n]: ").strip().lower()
-    if show == 'y':
+    if args.show or prompt("\nDisplay observation table? [y/n]: ").lower() == 'y':
         print("\n" + obs_text)
     else:
         print("\nObservation table saved to randomness_observation.txt")
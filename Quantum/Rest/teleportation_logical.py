@@ -1,13 +1,25 @@
 import random
+import sys
+
+# split a random byte into the two Bell-measurement bits (m1 = bit 0, m2 = bit 1)
+M1_OF_BYTE = bytes(b & 1 for b in range(256))
+M2_OF_BYTE = bytes((b >> 1) & 1 for b in range(256))
 
 
 def teleport(symbol):
-    m1 = random.randint(0, 1)
-    m2 = random.randint(0, 1)
+    # both Bell-measurement bits come from a single 2-bit draw
+    r = random.getrandbits(2)
+    m1, m2 = r & 1, r >> 1
     final_state = symbol
     return m1, m2, final_state
 
 
+def teleport_batch(n, symbol):
+    # n teleportations at once: one randbytes draw, split into m1 and m2 as 0/1 bytes
+    r = random.randbytes(max(n, 0))
+    return r.translate(M1_OF_BYTE), r.translate(M2_OF_BYTE), symbol
+
+
 def main():
     print("=== Quantum Teleportation (Symbolic Simulation) ===")
     print("Choose a state |ψ> to teleport:")
@@ -20,15 +32,16 @@ def main():
     mapping = {'1': '0', '2': '1', '3': '+', '4': '-'}
     symbol = mapping.get(choice, '0')
 
-    print(f"\nPreparing state |{symbol}> on the sender's side...")
-    print("Creating entangled pair shared between sender and receiver...")
-    print("Performing Bell measurement and sending 2 classical bits...")
-
     m1, m2, final_state = teleport(symbol)
 
-    print("\n--- Results ---")
-    print(f"Measurement bits sent over classical channel: ({m1}, {m2})")
-    print(f"State at receiver after applying corrections: |{final_state}>")
+    report_lines = []
+    report_lines.append(f"\nPreparing state |{symbol}> on the sender's side...")
+    report_lines.append("Creating entangled pair shared between sender and receiver...")
+    report_lines.append("Performing Bell measurement and sending 2 classical bits...")
+    report_lines.append("\n--- Results ---")
+    report_lines.append(f"Measurement bits sent over classical channel: ({m1}, {m2})")
+    report_lines.append(f"State at receiver after applying corrections: |{final_state}>")
+    sys.stdout.write("\n".join(report_lines) + "\n")
 
     obs_lines = []
     obs_lines.append("Observation Table - Teleportation (Symbolic)")